@@ -16,221 +16,358 @@ Usage:
     python cli.py upload-test video.mp4  # Test YouTube upload
 """
 
-import argparse
-import asyncio
-import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if TYPE_CHECKING:
+    import argparse
 
 
-async def main():
-    parser = argparse.ArgumentParser(
-        description="AI Video Workflow Project Manager CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
+COMMAND_HELP = {
+    "status": "Check project status",
+    "generate": "Generate a new episode",
+    "history": "View episode history",
+    "migrate": "Run database migrations",
+    "cleanup": "Clean up old files",
+    "init": "Initialize database",
+    "youtube-auth": "Get new YouTube refresh token",
+    "upload-test": "Test YouTube upload with a video file",
+}
+
+
+def _print_help() -> None:
+    """Print the top-level usage without building any command parser."""
+    width = max(len(name) for name in COMMAND_HELP)
+    lines = [
+        "usage: cli.py <command> [options]",
+        "",
+        "AI Video Workflow Project Manager CLI",
+        "",
+        "commands:",
+        *(f"  {name:<{width}}  {help_text}" for name, help_text in COMMAND_HELP.items()),
+        "",
+        "Run 'cli.py <command> --help' for command options.",
+    ]
+    print("\n".join(lines))
+
+
+def _command_parser(command: str) -> "argparse.ArgumentParser":
+    # argparse is only imported once a real command has been dispatched
+    import argparse
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    return argparse.ArgumentParser(prog=f"cli.py {command}", description=COMMAND_HELP[command])
 
-    # Status command
-    subparsers.add_parser("status", help="Check project status")
 
-    # Generate command
-    generate_parser = subparsers.add_parser("generate", help="Generate a new episode")
-    generate_parser.add_argument(
+def _build_status_parser() -> "argparse.ArgumentParser":
+    return _command_parser("status")
+
+
+def _build_generate_parser() -> "argparse.ArgumentParser":
+    parser = _command_parser("generate")
+    parser.add_argument(
         "episode",
         type=int,
         nargs="?",
         help="Episode number (optional, auto-increments if not specified)",
     )
-    generate_parser.add_argument(
+    parser.add_argument(
         "--private",
         action="store_true",
         help="Upload as private video (for testing)",
     )
+    return parser
 
-    # History command
-    history_parser = subparsers.add_parser("history", help="View episode history")
-    history_parser.add_argument(
+
+def _build_history_parser() -> "argparse.ArgumentParser":
+    parser = _command_parser("history")
+    parser.add_argument(
         "limit",
         type=int,
         nargs="?",
         default=10,
         help="Number of episodes to show (default: 10)",
     )
+    return parser
+
 
-    # Migrate command
-    migrate_parser = subparsers.add_parser("migrate", help="Run database migrations")
-    migrate_parser.add_argument(
+def _build_migrate_parser() -> "argparse.ArgumentParser":
+    parser = _command_parser("migrate")
+    parser.add_argument(
         "--action",
         choices=["upgrade", "downgrade", "current", "history"],
         default="upgrade",
         help="Migration action (default: upgrade)",
     )
-    migrate_parser.add_argument(
+    parser.add_argument(
         "--revision",
         default="head",
         help="Target revision (default: head)",
     )
+    return parser
 
-    # Cleanup command
-    cleanup_parser = subparsers.add_parser("cleanup", help="Clean up old files")
-    cleanup_parser.add_argument(
+
+def _build_cleanup_parser() -> "argparse.ArgumentParser":
+    parser = _command_parser("cleanup")
+    parser.add_argument(
         "--days",
         type=int,
         default=7,
         help="Delete files older than N days (default: 7)",
     )
-    cleanup_parser.add_argument(
+    parser.add_argument(
         "--execute",
         action="store_true",
         help="Actually delete files (default is dry-run)",
     )
+    return parser
+
+
+def _build_init_parser() -> "argparse.ArgumentParser":
+    return _command_parser("init")
+
 
-    # Init command
-    subparsers.add_parser("init", help="Initialize database")
+def _build_youtube_auth_parser() -> "argparse.ArgumentParser":
+    return _command_parser("youtube-auth")
 
-    # YouTube auth command
-    subparsers.add_parser("youtube-auth", help="Get new YouTube refresh token")
 
-    # Upload test command
-    upload_parser = subparsers.add_parser("upload-test", help="Test YouTube upload with a video file")
-    upload_parser.add_argument(
+def _build_upload_test_parser() -> "argparse.ArgumentParser":
+    parser = _command_parser("upload-test")
+    parser.add_argument(
         "video_path",
         type=str,
         help="Path to video file to upload",
     )
-    upload_parser.add_argument(
+    parser.add_argument(
         "--title",
         type=str,
         default="테스트 영상",
         help="Video title (default: '테스트 영상')",
     )
-    upload_parser.add_argument(
+    parser.add_argument(
         "--description",
         type=str,
         default="YouTube 업로드 테스트입니다.",
         help="Video description",
     )
-    upload_parser.add_argument(
+    parser.add_argument(
         "--private",
         action="store_true",
         help="Upload as private video",
     )
+    return parser
 
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
-        return 1
+def _dumps(data: object) -> str:
+    """Render result data as indented JSON (orjson when installed, json otherwise)."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    ).decode()
+
 
-    # Import here to avoid circular imports
+async def _run_with_agent(command: str, **kwargs) -> int:
+    """Run a project manager command inside a database session and print the result."""
+    # Imported lazily so --help and YouTube-only commands skip the agent/DB import tree
     from src.agents.project_manager_agent import ProjectManagerAgent
+    from src.config import settings
     from src.database import AsyncSessionLocal
+    from src.logging_setup import setup_logging
+
+    setup_logging()
+    settings.ensure_dirs()
+    async with AsyncSessionLocal() as session:
+        agent = ProjectManagerAgent(db_session=session)
+        result = await agent.run(command, **kwargs)
+
+    # Print result (built up front and written once)
+    out = [
+        "",
+        "=" * 50,
+        f"Command: {command}",
+        f"Success: {result.success}",
+        f"Message: {result.message}",
+    ]
+    if result.data:
+        out.extend(["", "Data:", _dumps(result.data)])
+    out.extend(["=" * 50, "", ""])
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+    return 0 if result.success else 1
+
+
+async def _status(_args: "argparse.Namespace") -> int:
+    return await _run_with_agent("status")
+
+
+async def _generate(args: "argparse.Namespace") -> int:
+    return await _run_with_agent("generate", episode=args.episode, private=args.private)
+
+
+async def _history(args: "argparse.Namespace") -> int:
+    return await _run_with_agent("history", limit=args.limit)
+
+
+async def _migrate(args: "argparse.Namespace") -> int:
+    return await _run_with_agent("migrate", action=args.action, revision=args.revision)
+
+
+async def _cleanup(args: "argparse.Namespace") -> int:
+    return await _run_with_agent(
+        "cleanup",
+        older_than_days=args.days,
+        dry_run=not args.execute,
+    )
+
+
+async def _init(_args: "argparse.Namespace") -> int:
+    return await _run_with_agent("init")
 
-    try:
-        async with AsyncSessionLocal() as session:
-            agent = ProjectManagerAgent(db_session=session)
-
-            if args.command == "status":
-                result = await agent.run("status")
-            elif args.command == "generate":
-                result = await agent.run("generate", episode=args.episode, private=args.private)
-            elif args.command == "history":
-                result = await agent.run("history", limit=args.limit)
-            elif args.command == "migrate":
-                result = await agent.run(
-                    "migrate",
-                    action=args.action,
-                    revision=args.revision,
-                )
-            elif args.command == "cleanup":
-                result = await agent.run(
-                    "cleanup",
-                    older_than_days=args.days,
-                    dry_run=not args.execute,
-                )
-            elif args.command == "init":
-                result = await agent.run("init")
-            elif args.command == "youtube-auth":
-                # YouTube OAuth 인증
-                from src.youtube_uploader import YouTubeUploader
-
-                uploader = YouTubeUploader.__new__(YouTubeUploader)
-                uploader.credentials = None
-                uploader.youtube = None
-
-                # 인증 URL 생성
-                auth_url = uploader.get_auth_url()
-                print("\n=== YouTube 인증 ===")
-                print("아래 URL을 브라우저에서 열고 Google 계정으로 로그인하세요:")
-                print(f"\n{auth_url}\n")
-                print("인증 후 리다이렉트된 URL에서 'code=' 뒤의 값을 복사하세요.")
-                code = input("인증 코드를 입력하세요: ").strip()
-
-                if code:
-                    tokens = uploader.exchange_code(code)
-                    print("\n성공! 아래 refresh_token을 .env 파일에 저장하세요:")
-                    print(f"\nYOUTUBE_REFRESH_TOKEN={tokens['refresh_token']}\n")
-                return 0
-            elif args.command == "upload-test":
-                # Direct YouTube upload test (bypasses workflow)
-                from pathlib import Path as P
-
-                from src.youtube_uploader import YouTubeUploader
-
-                video_path = P(args.video_path)
-                if not video_path.exists():
-                    print(f"Error: 영상 파일을 찾을 수 없습니다: {video_path}")
-                    return 1
-
-                print(f"YouTube 업로드 테스트 시작...")
-                print(f"  파일: {video_path}")
-                print(f"  제목: {args.title}")
-                print(f"  공개 설정: {'비공개' if args.private else '공개'}")
-
-                uploader = YouTubeUploader()
-                privacy = "private" if args.private else "public"
-                upload_result = await uploader.upload(
-                    video_path=str(video_path),
-                    title=args.title,
-                    description=args.description,
-                    tags=["테스트", "AI", "넝심이"],
-                    privacy_status=privacy,
-                    is_shorts=True,
-                )
-
-                print(f"\n업로드 성공!")
-                print(f"  Video ID: {upload_result.video_id}")
-                print(f"  URL: {upload_result.url}")
-                return 0
-            else:
-                print(f"Unknown command: {args.command}")
-                return 1
-
-            # Print result
-            print(f"\n{'=' * 50}")
-            print(f"Command: {args.command}")
-            print(f"Success: {result.success}")
-            print(f"Message: {result.message}")
-            if result.data:
-                print("\nData:")
-                print(json.dumps(result.data, indent=2, ensure_ascii=False, default=str))
-            print(f"{'=' * 50}\n")
-
-            return 0 if result.success else 1
 
+def _youtube_auth(_args: "argparse.Namespace") -> int:
+    """YouTube OAuth 인증"""
+    from src.youtube_uploader import YouTubeUploader
+
+    uploader = YouTubeUploader()
+
+    # 인증 URL 생성
+    auth_url = uploader.get_auth_url()
+    print("\n=== YouTube 인증 ===")
+    print("아래 URL을 브라우저에서 열고 Google 계정으로 로그인하세요:")
+    print(f"\n{auth_url}\n")
+    print("인증 후 리다이렉트된 URL에서 'code=' 뒤의 값을 복사하세요.")
+    code = input("인증 코드를 입력하세요: ").strip()
+
+    if code:
+        tokens = uploader.exchange_code(code)
+        print("\n성공! 아래 refresh_token을 .env 파일에 저장하세요:")
+        print(f"\nYOUTUBE_REFRESH_TOKEN={tokens['refresh_token']}\n")
+    return 0
+
+
+async def _upload_test(args: "argparse.Namespace") -> int:
+    """Direct YouTube upload test (bypasses workflow)"""
+    from src.youtube_uploader import YouTubeUploader
+
+    video_path = Path(args.video_path)
+    if not video_path.exists():
+        print(f"Error: 영상 파일을 찾을 수 없습니다: {video_path}")
+        return 1
+
+    print("YouTube 업로드 테스트 시작...")
+    print(f"  파일: {video_path}")
+    print(f"  제목: {args.title}")
+    print(f"  공개 설정: {'비공개' if args.private else '공개'}")
+
+    uploader = YouTubeUploader()
+    privacy = "private" if args.private else "public"
+    upload_result = await uploader.upload(
+        video_path=str(video_path),
+        title=args.title,
+        description=args.description,
+        tags=["테스트", "AI", "넝심이"],
+        privacy_status=privacy,
+        is_shorts=True,
+    )
+
+    print("\n업로드 성공!")
+    print(f"  Video ID: {upload_result.video_id}")
+    print(f"  URL: {upload_result.url}")
+    return 0
+
+
+# command -> (handler, parser builder); only the invoked command's parser is built
+COMMANDS = {
+    "status": (_status, _build_status_parser),
+    "generate": (_generate, _build_generate_parser),
+    "history": (_history, _build_history_parser),
+    "migrate": (_migrate, _build_migrate_parser),
+    "cleanup": (_cleanup, _build_cleanup_parser),
+    "init": (_init, _build_init_parser),
+    "upload-test": (_upload_test, _build_upload_test_parser),
+}
+
+# Interactive commands with no async work; they run without starting an event loop
+SYNC_COMMANDS = {
+    "youtube-auth": (_youtube_auth, _build_youtube_auth_parser),
+}
+
+
+def _run_sync(argv: list[str]) -> int:
+    handler, build_parser = SYNC_COMMANDS[argv[0]]
+    args = build_parser().parse_args(argv[1:])
+
+    try:
+        return handler(args)
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
+        sys.excepthook(*sys.exc_info())
+        return 1
+
 
-        traceback.print_exc()
+def _fast_path(argv: list[str]) -> int | None:
+    """Answer bare and --help invocations before any event loop or agent import."""
+    if not argv:
+        _print_help()
+        return 1
+    if argv[0] in ("-h", "--help"):
+        _print_help()
+        return 0
+    return None
+
+
+async def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    code = _fast_path(argv)
+    if code is not None:
+        return code
+
+    command = argv[0]
+    if command in SYNC_COMMANDS:
+        return _run_sync(argv)
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n")
+        _print_help()
         return 1
 
+    handler, build_parser = COMMANDS[command]
+    args = build_parser().parse_args(argv[1:])
 
-if __name__ == "__main__":
+    try:
+        return await handler(args)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.excepthook(*sys.exc_info())
+        return 1
+
+
+def main_sync() -> None:
+    """Console-script entry point (``ai-video``)."""
+    argv = sys.argv[1:]
+    code = _fast_path(argv)
+    if code is not None:
+        sys.exit(code)
+    if argv[0] in SYNC_COMMANDS:
+        sys.exit(_run_sync(argv))
+
+    import asyncio
+
+    # uvloop is optional; fall back to the default event loop when it is not installed
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
     sys.exit(asyncio.run(main()))
+
+
+if __name__ == "__main__":
+    main_sync()
@@ -4,9 +4,9 @@ import asyncio
 import sys
 from pathlib import Path
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 스크립트로 직접 실행할 때만 프로젝트 루트를 Python 경로에 추가
+if __package__ is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import close_db, init_db
 
@@ -19,9 +19,7 @@ async def main():
         print("✅ 데이터베이스 초기화 완료!")
     except Exception as error:
         print(f"❌ 데이터베이스 초기화 오류: {error}")
-        import traceback
-
-        traceback.print_exc()
+        sys.excepthook(*sys.exc_info())
         sys.exit(1)
     finally:
         await close_db()
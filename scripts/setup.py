@@ -4,6 +4,7 @@
 import argparse
 import os
 import sys
+from collections import defaultdict
 from getpass import getpass
 from pathlib import Path
 
@@ -68,45 +69,60 @@ def collect_config() -> dict:
     return config
 
 
-def generate_env(config: dict) -> None:
-    """Generate .env file"""
-    content = f"""# Google API (Gemini + Veo3)
-GOOGLE_API_KEY={config.get("GOOGLE_API_KEY", "")}
+_ENV_TEMPLATE = """# Google API (Gemini + Veo3)
+GOOGLE_API_KEY={GOOGLE_API_KEY}
 
 # YouTube API
-YOUTUBE_CLIENT_ID={config.get("YOUTUBE_CLIENT_ID", "")}
-YOUTUBE_CLIENT_SECRET={config.get("YOUTUBE_CLIENT_SECRET", "")}
-YOUTUBE_REFRESH_TOKEN={config.get("YOUTUBE_REFRESH_TOKEN", "")}
+YOUTUBE_CLIENT_ID={YOUTUBE_CLIENT_ID}
+YOUTUBE_CLIENT_SECRET={YOUTUBE_CLIENT_SECRET}
+YOUTUBE_REFRESH_TOKEN={YOUTUBE_REFRESH_TOKEN}
 
 # PostgreSQL
-DB_USER={config.get("DB_USER", "postgres")}
-DB_PASSWORD={config.get("DB_PASSWORD", "")}
-DB_HOST={config.get("DB_HOST", "localhost")}
-DB_PORT={config.get("DB_PORT", "5432")}
-DB_NAME={config.get("DB_NAME", "ai_video_workflow")}
+DB_USER={DB_USER}
+DB_PASSWORD={DB_PASSWORD}
+DB_HOST={DB_HOST}
+DB_PORT={DB_PORT}
+DB_NAME={DB_NAME}
 """
-    path = PROJECT_ROOT / ".env"
-    path.write_text(content)
-    print(f"✓ {path} 생성됨")
-
 
-def generate_k8s_secrets(config: dict) -> None:
-    """Generate Kubernetes secrets"""
-    content = f"""apiVersion: v1
+_K8S_SECRETS_TEMPLATE = """apiVersion: v1
 kind: Secret
 metadata:
   name: ai-video-secrets
 type: Opaque
 stringData:
-  GOOGLE_API_KEY: "{config.get("GOOGLE_API_KEY", "")}"
-  YOUTUBE_CLIENT_ID: "{config.get("YOUTUBE_CLIENT_ID", "")}"
-  YOUTUBE_CLIENT_SECRET: "{config.get("YOUTUBE_CLIENT_SECRET", "")}"
-  YOUTUBE_REFRESH_TOKEN: "{config.get("YOUTUBE_REFRESH_TOKEN", "")}"
-  DB_PASSWORD: "{config.get("DB_PASSWORD", "")}"
+  GOOGLE_API_KEY: "{GOOGLE_API_KEY}"
+  YOUTUBE_CLIENT_ID: "{YOUTUBE_CLIENT_ID}"
+  YOUTUBE_CLIENT_SECRET: "{YOUTUBE_CLIENT_SECRET}"
+  YOUTUBE_REFRESH_TOKEN: "{YOUTUBE_REFRESH_TOKEN}"
+  DB_PASSWORD: "{DB_PASSWORD}"
 """
+
+_CONFIG_DEFAULTS = {
+    "DB_USER": "postgres",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "ai_video_workflow",
+}
+
+
+def _template_values(config: dict) -> defaultdict:
+    """템플릿 치환값 (누락된 키는 기본값 또는 빈 문자열)"""
+    return defaultdict(str, {**_CONFIG_DEFAULTS, **config})
+
+
+def generate_env(config: dict) -> None:
+    """Generate .env file"""
+    path = PROJECT_ROOT / ".env"
+    path.write_text(_ENV_TEMPLATE.format_map(_template_values(config)))
+    print(f"✓ {path} 생성됨")
+
+
+def generate_k8s_secrets(config: dict) -> None:
+    """Generate Kubernetes secrets"""
     path = PROJECT_ROOT / "k8s" / "secrets.yaml"
     path.parent.mkdir(exist_ok=True)
-    path.write_text(content)
+    path.write_text(_K8S_SECRETS_TEMPLATE.format_map(_template_values(config)))
     print(f"✓ {path} 생성됨 (git에 커밋하지 마세요!)")
 
 
@@ -1,10 +1,28 @@
 """Agents module for AI Video Workflow."""
 
-from src.agents.base import BaseAgent
-from src.agents.project_manager_agent import ProjectManagerAgent, ProjectManagerResult
-from src.agents.story_agent import StoryAgent, StoryAgentResult
-from src.agents.video_agent import VideoAgent, VideoAgentResult
-from src.agents.youtube_agent import YouTubeAgent, YouTubeAgentResult
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.agents.base import BaseAgent
+    from src.agents.project_manager_agent import ProjectManagerAgent, ProjectManagerResult
+    from src.agents.story_agent import StoryAgent, StoryAgentResult
+    from src.agents.video_agent import VideoAgent, VideoAgentResult
+    from src.agents.youtube_agent import YouTubeAgent, YouTubeAgentResult
+
+# Agents are resolved on first access so importing one agent does not pull in
+# the Gemini, Veo3 and YouTube client trees of the others.
+_LAZY = {
+    "BaseAgent": ("src.agents.base", "BaseAgent"),
+    "StoryAgent": ("src.agents.story_agent", "StoryAgent"),
+    "StoryAgentResult": ("src.agents.story_agent", "StoryAgentResult"),
+    "VideoAgent": ("src.agents.video_agent", "VideoAgent"),
+    "VideoAgentResult": ("src.agents.video_agent", "VideoAgentResult"),
+    "YouTubeAgent": ("src.agents.youtube_agent", "YouTubeAgent"),
+    "YouTubeAgentResult": ("src.agents.youtube_agent", "YouTubeAgentResult"),
+    "ProjectManagerAgent": ("src.agents.project_manager_agent", "ProjectManagerAgent"),
+    "ProjectManagerResult": ("src.agents.project_manager_agent", "ProjectManagerResult"),
+}
 
 __all__ = [
     # Base
@@ -20,3 +38,17 @@ __all__ = [
     "ProjectManagerAgent",
     "ProjectManagerResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
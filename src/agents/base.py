@@ -1,19 +1,22 @@
 """Base agent class for AI Video Workflow."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from typing import Any
 
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.skills.base import BaseSkill
 
 
-class AgentState(BaseModel):
+@dataclass(slots=True)
+class AgentState:
     """Base state for agents."""
 
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
 
 
 class BaseAgent(ABC):
@@ -22,9 +25,17 @@ class BaseAgent(ABC):
     name: str = "base_agent"
     description: str = "Base agent"
 
+    # Skill factories, each called with the agent instance during __init__.
+    # DB_SKILL_FACTORIES are only used when the agent has a database session.
+    SKILL_FACTORIES: tuple[Callable[["BaseAgent"], BaseSkill], ...] = ()
+    DB_SKILL_FACTORIES: tuple[Callable[["BaseAgent"], BaseSkill], ...] = ()
+
     def __init__(self, db_session: AsyncSession | None = None):
         self.db_session = db_session
-        self._skills: dict[str, BaseSkill] = {}
+        factories = self.SKILL_FACTORIES + (self.DB_SKILL_FACTORIES if db_session else ())
+        self._skills: dict[str, BaseSkill] = {
+            skill.name: skill for skill in (factory(self) for factory in factories)
+        }
 
     def register_skill(self, skill: BaseSkill) -> None:
         """Register a skill to this agent."""
@@ -1,14 +1,12 @@
 """Project manager agent for AI Video Workflow."""
 
-from typing import Any
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.base import BaseAgent
-from src.agents.story_agent import StoryAgent
-from src.agents.video_agent import VideoAgent
-from src.agents.youtube_agent import YouTubeAgent
 from src.skills.project_skills import (
     CheckProjectStatusSkill,
     CleanupFilesSkill,
@@ -20,16 +18,25 @@ from src.skills.project_skills import (
     WorkflowRunResult,
 )
 
+if TYPE_CHECKING:
+    from src.agents.story_agent import StoryAgent
+    from src.agents.video_agent import VideoAgent
+    from src.agents.youtube_agent import YouTubeAgent
 
-class ProjectManagerResult(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ProjectManagerResult:
     """Result of project manager operations."""
 
     success: bool = False
     message: str = ""
     data: dict | None = None
 
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
 
 
 class ProjectManagerAgent(BaseAgent):
@@ -49,25 +56,52 @@ class ProjectManagerAgent(BaseAgent):
     name = "project_manager_agent"
     description = "Manages the AI Video Workflow project including workflow execution, status monitoring, and maintenance"
 
+    SKILL_FACTORIES = (
+        lambda agent: CheckProjectStatusSkill(agent.db_session),
+        lambda _agent: RunWorkflowSkill(),
+        lambda _agent: RunDatabaseMigrationSkill(),
+        lambda _agent: CleanupFilesSkill(),
+        lambda _agent: InitializeDatabaseSkill(),
+    )
+    DB_SKILL_FACTORIES = (lambda agent: ViewHistorySkill(agent.db_session),)
+
     def __init__(self, db_session: AsyncSession | None = None):
         super().__init__(db_session)
 
-        # Sub-agents for specialized tasks
-        self.story_agent = StoryAgent(db_session=db_session)
-        self.video_agent = VideoAgent(db_session=db_session)
-        self.youtube_agent = YouTubeAgent(db_session=db_session)
+        # Sub-agents for specialized tasks (created on first access)
+        self._story_agent: StoryAgent | None = None
+        self._video_agent: VideoAgent | None = None
+        self._youtube_agent: YouTubeAgent | None = None
+
+        # (limit, entries) of the last history fetch; cleared when a workflow runs
+        self._history_cache: tuple[int, list[dict]] | None = None
+
+    @property
+    def story_agent(self) -> "StoryAgent":
+        """Story sub-agent, constructed on first use."""
+        if self._story_agent is None:
+            from src.agents.story_agent import StoryAgent
 
-        self._setup_skills()
+            self._story_agent = StoryAgent(db_session=self.db_session)
+        return self._story_agent
 
-    def _setup_skills(self) -> None:
-        """Register project management skills."""
-        self.register_skill(CheckProjectStatusSkill(self.db_session))
-        self.register_skill(RunWorkflowSkill())
-        self.register_skill(RunDatabaseMigrationSkill())
-        self.register_skill(CleanupFilesSkill())
-        self.register_skill(InitializeDatabaseSkill())
-        if self.db_session:
-            self.register_skill(ViewHistorySkill(self.db_session))
+    @property
+    def video_agent(self) -> "VideoAgent":
+        """Video sub-agent, constructed on first use."""
+        if self._video_agent is None:
+            from src.agents.video_agent import VideoAgent
+
+            self._video_agent = VideoAgent(db_session=self.db_session)
+        return self._video_agent
+
+    @property
+    def youtube_agent(self) -> "YouTubeAgent":
+        """YouTube sub-agent, constructed on first use."""
+        if self._youtube_agent is None:
+            from src.agents.youtube_agent import YouTubeAgent
+
+            self._youtube_agent = YouTubeAgent(db_session=self.db_session)
+        return self._youtube_agent
 
     async def get_status(self) -> ProjectStatus | None:
         """Get overall project status."""
@@ -78,6 +112,7 @@ class ProjectManagerAgent(BaseAgent):
         self, episode: int | None = None, private: bool = False
     ) -> WorkflowRunResult | None:
         """Run the video generation workflow."""
+        self._history_cache = None
         result = await self.execute_skill("run_workflow", episode=episode, private=private)
         return result.data if result.is_success else None
 
@@ -85,8 +120,13 @@ class ProjectManagerAgent(BaseAgent):
         """View recent story history."""
         if not self.db_session:
             return []
+        if self._history_cache and limit <= self._history_cache[0]:
+            return self._history_cache[1][:limit]
         result = await self.execute_skill("view_history", limit=limit)
-        return result.data if result.is_success else []
+        if not result.is_success:
+            return []
+        self._history_cache = (limit, result.data)
+        return result.data
 
     async def run_migration(
         self,
@@ -128,13 +168,13 @@ class ProjectManagerAgent(BaseAgent):
         This is the main entry point for generating content.
         """
         mode = "PRIVATE" if private else "PUBLIC"
-        print(f"[ProjectManager] Starting episode generation ({mode})...")
+        logger.info("[ProjectManager] Starting episode generation (%s)...", mode)
 
         # Check status first
         status = await self.get_status()
         if status:
-            print(f"[ProjectManager] Current episodes: {status.total_episodes}")
-            print(f"[ProjectManager] API keys configured: {status.api_keys_configured}")
+            logger.info("[ProjectManager] Current episodes: %s", status.total_episodes)
+            logger.info("[ProjectManager] API keys configured: %s", status.api_keys_configured)
 
         # Run workflow
         workflow_result = await self.run_workflow(episode=episode, private=private)
@@ -162,6 +202,73 @@ class ProjectManagerAgent(BaseAgent):
                 data={"error": workflow_result.error},
             )
 
+    async def _cmd_status(self) -> ProjectManagerResult:
+        status = await self.get_status()
+        if status:
+            return ProjectManagerResult(
+                success=True,
+                message="Project status retrieved",
+                data=asdict(status),
+            )
+        return ProjectManagerResult(success=False, message="Failed to get status")
+
+    async def _cmd_generate(
+        self, episode: int | None = None, private: bool = False
+    ) -> ProjectManagerResult:
+        return await self.generate_episode(episode=episode, private=private)
+
+    async def _cmd_history(self, limit: int = 10) -> ProjectManagerResult:
+        history = await self.view_history(limit=limit)
+        return ProjectManagerResult(
+            success=True,
+            message=f"Retrieved {len(history)} episodes",
+            data={"episodes": history},
+        )
+
+    async def _cmd_migrate(
+        self, action: str = "upgrade", revision: str = "head"
+    ) -> ProjectManagerResult:
+        result = await self.run_migration(action=action, revision=revision)
+        if result:
+            return ProjectManagerResult(
+                success=True,
+                message="Migration completed",
+                data={"output": result},
+            )
+        return ProjectManagerResult(success=False, message="Migration failed")
+
+    async def _cmd_cleanup(
+        self, older_than_days: int = 7, dry_run: bool = True
+    ) -> ProjectManagerResult:
+        result = await self.cleanup(
+            older_than_days=older_than_days,
+            dry_run=dry_run,
+        )
+        if result:
+            return ProjectManagerResult(
+                success=True,
+                message="Cleanup completed" if not dry_run else "Dry run completed",
+                data=result,
+            )
+        return ProjectManagerResult(success=False, message="Cleanup failed")
+
+    async def _cmd_init(self) -> ProjectManagerResult:
+        success = await self.initialize_database()
+        return ProjectManagerResult(
+            success=success,
+            message="Database initialized" if success else "Initialization failed",
+        )
+
+    # command -> (handler method, accepted keyword arguments)
+    _DISPATCH: dict[str, tuple[str, tuple[str, ...]]] = {
+        "status": ("_cmd_status", ()),
+        "generate": ("_cmd_generate", ("episode", "private")),
+        "history": ("_cmd_history", ("limit",)),
+        "migrate": ("_cmd_migrate", ("action", "revision")),
+        "cleanup": ("_cmd_cleanup", ("older_than_days", "dry_run")),
+        "init": ("_cmd_init", ()),
+    }
+
     async def run(self, command: str = "status", **kwargs: Any) -> ProjectManagerResult:
         """
         Run project manager commands.
@@ -174,71 +281,17 @@ class ProjectManagerAgent(BaseAgent):
         - cleanup: Clean up old files
         - init: Initialize database
         """
-        try:
-            if command == "status":
-                status = await self.get_status()
-                if status:
-                    return ProjectManagerResult(
-                        success=True,
-                        message="Project status retrieved",
-                        data=status.model_dump(),
-                    )
-                return ProjectManagerResult(success=False, message="Failed to get status")
-
-            elif command == "generate":
-                episode = kwargs.get("episode")
-                private = kwargs.get("private", False)
-                return await self.generate_episode(episode=episode, private=private)
-
-            elif command == "history":
-                limit = kwargs.get("limit", 10)
-                history = await self.view_history(limit=limit)
-                return ProjectManagerResult(
-                    success=True,
-                    message=f"Retrieved {len(history)} episodes",
-                    data={"episodes": history},
-                )
-
-            elif command == "migrate":
-                action = kwargs.get("action", "upgrade")
-                revision = kwargs.get("revision", "head")
-                result = await self.run_migration(action=action, revision=revision)
-                if result:
-                    return ProjectManagerResult(
-                        success=True,
-                        message="Migration completed",
-                        data={"output": result},
-                    )
-                return ProjectManagerResult(success=False, message="Migration failed")
-
-            elif command == "cleanup":
-                older_than_days = kwargs.get("older_than_days", 7)
-                dry_run = kwargs.get("dry_run", True)
-                result = await self.cleanup(
-                    older_than_days=older_than_days,
-                    dry_run=dry_run,
-                )
-                if result:
-                    return ProjectManagerResult(
-                        success=True,
-                        message="Cleanup completed" if not dry_run else "Dry run completed",
-                        data=result,
-                    )
-                return ProjectManagerResult(success=False, message="Cleanup failed")
-
-            elif command == "init":
-                success = await self.initialize_database()
-                return ProjectManagerResult(
-                    success=success,
-                    message="Database initialized" if success else "Initialization failed",
-                )
-
-            else:
-                return ProjectManagerResult(
-                    success=False,
-                    message=f"Unknown command: {command}. Available: status, generate, history, migrate, cleanup, init",
-                )
+        entry = self._DISPATCH.get(command)
+        if entry is None:
+            return ProjectManagerResult(
+                success=False,
+                message=f"Unknown command: {command}. Available: {', '.join(self._DISPATCH)}",
+            )
 
+        method_name, keys = entry
+        try:
+            method = getattr(self, method_name)
+            return await method(**{k: kwargs[k] for k in keys if k in kwargs})
         except Exception as e:
             return ProjectManagerResult(
                 success=False,
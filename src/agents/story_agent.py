@@ -1,8 +1,9 @@
 """Story generation agent for AI Video Workflow."""
 
-from typing import Any
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.base import BaseAgent
@@ -12,20 +13,26 @@ from src.skills.story_skills import (
     GetStoryHistorySkill,
     SaveStorySkill,
 )
-from src.story_generator import GeminiStoryGenerator
 
+if TYPE_CHECKING:
+    from src.story_generator import GeminiStoryGenerator
 
-class StoryAgentResult(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class StoryAgentResult:
     """Result of story agent execution."""
 
+    episode: int
     story: Story | None = None
     story_id: int | None = None
-    episode: int
     success: bool = False
     error: str | None = None
 
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
 
 
 class StoryAgent(BaseAgent):
@@ -34,29 +41,46 @@ class StoryAgent(BaseAgent):
     name = "story_agent"
     description = "Generates and manages cooking stories using Gemini API"
 
+    SKILL_FACTORIES = (
+        lambda agent: GenerateStorySkill(story_generator_factory=lambda: agent.story_generator),
+    )
+    DB_SKILL_FACTORIES = (
+        lambda agent: GetStoryHistorySkill(agent.db_session),
+        lambda agent: SaveStorySkill(agent.db_session),
+    )
+
     def __init__(
         self,
         db_session: AsyncSession | None = None,
-        story_generator: GeminiStoryGenerator | None = None,
+        story_generator: "GeminiStoryGenerator | None" = None,
     ):
+        self._story_generator = story_generator
+        # (limit, entries) of the last history fetch; cleared whenever a story is saved
+        self._history_cache: tuple[int, list[StoryHistoryEntry]] | None = None
         super().__init__(db_session)
-        self.story_generator = story_generator or GeminiStoryGenerator()
-        self._setup_skills()
 
-    def _setup_skills(self) -> None:
-        """Register skills for this agent."""
-        self.register_skill(GenerateStorySkill(self.story_generator))
-        if self.db_session:
-            self.register_skill(GetStoryHistorySkill(self.db_session))
-            self.register_skill(SaveStorySkill(self.db_session))
+    @property
+    def story_generator(self) -> "GeminiStoryGenerator":
+        """Gemini story generator, created on first use."""
+        if self._story_generator is None:
+            from src.story_generator import GeminiStoryGenerator
+
+            self._story_generator = GeminiStoryGenerator()
+        return self._story_generator
 
     async def get_history(self, limit: int = 50) -> list[StoryHistoryEntry]:
         """Get story history from database."""
         if not self.db_session:
             return []
 
+        if self._history_cache and limit <= self._history_cache[0]:
+            return self._history_cache[1][:limit]
+
         result = await self.execute_skill("get_story_history", limit=limit)
-        return result.data if result.is_success else []
+        if not result.is_success:
+            return []
+        self._history_cache = (limit, result.data)
+        return result.data
 
     async def generate_story(
         self,
@@ -71,18 +95,20 @@ class StoryAgent(BaseAgent):
         )
         return result.data if result.is_success else None
 
-    async def save_story(self, story: Story, episode: int) -> int | None:
+    async def save_story(self, story: Story, episode: int, commit: bool = True) -> int | None:
         """Save a story to the database."""
         if not self.db_session:
             return None
 
-        result = await self.execute_skill("save_story", story=story, episode=episode)
+        self._history_cache = None
+        result = await self.execute_skill("save_story", story=story, episode=episode, commit=commit)
         return result.data if result.is_success else None
 
     async def run(
         self,
         episode: int | None = None,
         save_to_db: bool = True,
+        commit: bool = True,
         **kwargs: Any,
     ) -> StoryAgentResult:
         """
@@ -91,6 +117,7 @@ class StoryAgent(BaseAgent):
         Args:
             episode: Episode number. If None, auto-increments from history.
             save_to_db: Whether to save the story to database.
+            commit: Whether to commit the save; False leaves it to the caller's transaction.
 
         Returns:
             StoryAgentResult with the generated story.
@@ -103,7 +130,7 @@ class StoryAgent(BaseAgent):
             if episode is None:
                 episode = len(history) + 1
 
-            print(f"[StoryAgent] Generating story for episode {episode}...")
+            logger.info("[StoryAgent] Generating story for episode %s...", episode)
 
             # Generate story
             story = await self.generate_story(episode, history)
@@ -114,14 +141,14 @@ class StoryAgent(BaseAgent):
                     error="Failed to generate story",
                 )
 
-            print(f"[StoryAgent] Generated: {story.title}")
+            logger.info("[StoryAgent] Generated: %s", story.title)
 
             # Save to database
             story_id = None
             if save_to_db and self.db_session:
-                story_id = await self.save_story(story, episode)
+                story_id = await self.save_story(story, episode, commit=commit)
                 if story_id:
-                    print(f"[StoryAgent] Saved to database with ID: {story_id}")
+                    logger.info("[StoryAgent] Saved to database with ID: %s", story_id)
 
             return StoryAgentResult(
                 story=story,
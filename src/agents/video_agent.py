@@ -1,9 +1,9 @@
 """Video generation agent for AI Video Workflow."""
 
-from datetime import datetime
-from typing import Any
+import logging
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.base import BaseAgent
@@ -14,21 +14,23 @@ from src.skills.video_skills import (
     SaveVideoGenerationSkill,
     UpdateVideoGenerationSkill,
 )
-from src.video_generator import Veo3VideoGenerator
 
+if TYPE_CHECKING:
+    from src.video_generator import Veo3VideoGenerator
+
+logger = logging.getLogger(__name__)
 
 class VideoAgentResult(BaseModel):
     """Result of video agent execution."""
 
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
     video_path: str | None = None
     video_generation_id: int | None = None
     segment_count: int = 0
     success: bool = False
     error: str | None = None
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class VideoAgent(BaseAgent):
     """Agent responsible for video generation and management."""
@@ -36,23 +38,34 @@ class VideoAgent(BaseAgent):
     name = "video_agent"
     description = "Generates videos using Veo3 API and manages video files"
 
+    SKILL_FACTORIES = (
+        lambda agent: GenerateVideoSkill(video_generator_factory=lambda: agent.video_generator),
+        lambda agent: GenerateVideoSequenceSkill(
+            video_generator_factory=lambda: agent.video_generator
+        ),
+        lambda agent: MergeVideosSkill(video_generator_factory=lambda: agent.video_generator),
+    )
+    DB_SKILL_FACTORIES = (
+        lambda agent: SaveVideoGenerationSkill(agent.db_session),
+        lambda agent: UpdateVideoGenerationSkill(agent.db_session),
+    )
+
     def __init__(
         self,
         db_session: AsyncSession | None = None,
-        video_generator: Veo3VideoGenerator | None = None,
+        video_generator: "Veo3VideoGenerator | None" = None,
     ):
+        self._video_generator = video_generator
         super().__init__(db_session)
-        self.video_generator = video_generator or Veo3VideoGenerator()
-        self._setup_skills()
-
-    def _setup_skills(self) -> None:
-        """Register skills for this agent."""
-        self.register_skill(GenerateVideoSkill(self.video_generator))
-        self.register_skill(GenerateVideoSequenceSkill(self.video_generator))
-        self.register_skill(MergeVideosSkill(self.video_generator))
-        if self.db_session:
-            self.register_skill(SaveVideoGenerationSkill(self.db_session))
-            self.register_skill(UpdateVideoGenerationSkill(self.db_session))
+
+    @property
+    def video_generator(self) -> "Veo3VideoGenerator":
+        """Veo3 video generator, created on first use."""
+        if self._video_generator is None:
+            from src.video_generator import Veo3VideoGenerator
+
+            self._video_generator = Veo3VideoGenerator()
+        return self._video_generator
 
     async def generate_single_video(
         self,
@@ -75,9 +88,15 @@ class VideoAgent(BaseAgent):
         duration: int = 5,
         output_filename: str | None = None,
     ) -> str | None:
-        """Generate a video sequence from multiple prompts."""
+        """Generate segments and merge them in prompt order.
+
+        Concurrency, retries, duplicate-prompt reuse and segment cleanup all live in
+        Veo3VideoGenerator.generate_video_sequence, so this path gets the same behaviour.
+        """
         if output_filename is None:
-            output_filename = f"video_{int(datetime.now().timestamp())}.mp4"
+            from src.video_generator import _unique_filename
+
+            output_filename = _unique_filename("video")
 
         result = await self.execute_skill(
             "generate_video_sequence",
@@ -85,7 +104,10 @@ class VideoAgent(BaseAgent):
             duration=duration,
             output_filename=output_filename,
         )
-        return result.data if result.is_success else None
+        if not result.is_success:
+            logger.error("[VideoAgent] %s", result.error)
+            return None
+        return result.data or None
 
     async def merge_videos(
         self,
@@ -104,6 +126,9 @@ class VideoAgent(BaseAgent):
         self,
         story_id: int,
         status: str = "processing",
+        video_path: str | None = None,
+        error_message: str | None = None,
+        commit: bool = True,
     ) -> int | None:
         """Save a video generation record to database."""
         if not self.db_session:
@@ -113,6 +138,9 @@ class VideoAgent(BaseAgent):
             "save_video_generation",
             story_id=story_id,
             status=status,
+            video_path=video_path,
+            error_message=error_message,
+            commit=commit,
         )
         return result.data if result.is_success else None
 
@@ -122,6 +150,7 @@ class VideoAgent(BaseAgent):
         status: str | None = None,
         video_path: str | None = None,
         error_message: str | None = None,
+        commit: bool = True,
     ) -> bool:
         """Update a video generation record."""
         if not self.db_session:
@@ -133,6 +162,7 @@ class VideoAgent(BaseAgent):
             status=status,
             video_path=video_path,
             error_message=error_message,
+            commit=commit,
         )
         return result.is_success
 
@@ -142,6 +172,7 @@ class VideoAgent(BaseAgent):
         story_id: int | None = None,
         duration: int = 5,
         output_filename: str | None = None,
+        commit: bool = True,
         **kwargs: Any,
     ) -> VideoAgentResult:
         """
@@ -152,76 +183,72 @@ class VideoAgent(BaseAgent):
             story_id: Associated story ID for database tracking.
             duration: Duration of each video segment in seconds.
             output_filename: Output filename for the merged video.
+            commit: Whether to commit the generation record; False inserts it once the
+                result is known and leaves the commit to the caller.
 
         Returns:
             VideoAgentResult with the generated video path.
         """
-        video_generation_id = None
-
-        try:
-            # Create database record if story_id provided
-            if story_id and self.db_session:
-                video_generation_id = await self.save_generation_record(
-                    story_id=story_id,
-                    status="processing",
-                )
-                print(f"[VideoAgent] Created generation record: {video_generation_id}")
-
-            print(f"[VideoAgent] Generating {len(prompts)} video segments...")
+        track = bool(story_id and self.db_session)
+        video_generation_id: int | None = None
+        if track and commit:
+            # Commit the "processing" row before Veo3 starts so it is visible while
+            # segments generate, without holding a transaction open across the API calls
+            video_generation_id = await self.save_generation_record(
+                story_id=story_id, status="processing"
+            )
+            logger.info("[VideoAgent] Created generation record: %s", video_generation_id)
 
-            # Generate video sequence
-            if output_filename is None:
-                output_filename = f"video_{int(datetime.now().timestamp())}.mp4"
+        logger.info("[VideoAgent] Generating %d video segments...", len(prompts))
 
+        video_path: str | None = None
+        error_msg: str | None = None
+        try:
             video_path = await self.generate_video_sequence(
                 prompts=prompts,
                 duration=duration,
                 output_filename=output_filename,
             )
-
             if not video_path:
                 error_msg = "Failed to generate video sequence"
-                if video_generation_id:
-                    await self.update_generation_record(
-                        video_id=video_generation_id,
-                        status="failed",
-                        error_message=error_msg,
-                    )
-                return VideoAgentResult(
-                    video_generation_id=video_generation_id,
-                    segment_count=len(prompts),
-                    success=False,
-                    error=error_msg,
-                )
-
-            print(f"[VideoAgent] Generated video: {video_path}")
-
-            # Update database record
-            if video_generation_id:
-                await self.update_generation_record(
-                    video_id=video_generation_id,
-                    status="completed",
-                    video_path=video_path,
-                )
-
-            return VideoAgentResult(
+        except Exception as e:
+            error_msg = str(e)
+
+        status = "failed" if error_msg else "completed"
+        if video_generation_id:
+            await self.update_generation_record(
+                video_id=video_generation_id,
+                status=status,
                 video_path=video_path,
-                video_generation_id=video_generation_id,
-                segment_count=len(prompts),
-                success=True,
+                error_message=error_msg,
             )
+        elif track and not commit:
+            # The caller commits later: insert once with the final status instead
+            video_generation_id = await self.save_generation_record(
+                story_id=story_id,
+                status=status,
+                video_path=video_path,
+                error_message=error_msg,
+                commit=False,
+            )
+            logger.info("[VideoAgent] Created generation record: %s", video_generation_id)
 
-        except Exception as e:
-            error_msg = str(e)
-            if video_generation_id:
-                await self.update_generation_record(
-                    video_id=video_generation_id,
-                    status="failed",
-                    error_message=error_msg,
-                )
-            return VideoAgentResult(
+        if error_msg:
+            return VideoAgentResult.model_construct(
                 video_generation_id=video_generation_id,
                 segment_count=len(prompts),
                 success=False,
                 error=error_msg,
             )
+
+        logger.info(
+            "[VideoAgent] Generated video: %s",
+            video_path,
+            extra={"path": video_path, "count": len(prompts)},
+        )
+        return VideoAgentResult.model_construct(
+            video_path=video_path,
+            video_generation_id=video_generation_id,
+            segment_count=len(prompts),
+            success=True,
+        )
@@ -1,11 +1,15 @@
 """YouTube upload agent for AI Video Workflow."""
 
+import asyncio
+import logging
+import time
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.base import BaseAgent
+from src.config import settings
 from src.models import YouTubeUploadResult
 from src.skills.youtube_skills import (
     GetVideoInfoSkill,
@@ -14,19 +18,20 @@ from src.skills.youtube_skills import (
 )
 from src.youtube_uploader import YouTubeUploader
 
+logger = logging.getLogger(__name__)
+
 
 class YouTubeAgentResult(BaseModel):
     """Result of YouTube agent execution."""
 
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
     video_id: str | None = None
     video_url: str | None = None
     upload_record_id: int | None = None
     success: bool = False
     error: str | None = None
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class YouTubeAgent(BaseAgent):
     """Agent responsible for YouTube uploads and management."""
@@ -34,21 +39,22 @@ class YouTubeAgent(BaseAgent):
     name = "youtube_agent"
     description = "Uploads videos to YouTube and manages upload records"
 
+    SKILL_FACTORIES = (
+        lambda agent: UploadVideoSkill(agent.youtube_uploader),
+        lambda agent: GetVideoInfoSkill(agent.youtube_uploader),
+    )
+    DB_SKILL_FACTORIES = (lambda agent: SaveYouTubeUploadSkill(agent.db_session),)
+
     def __init__(
         self,
         db_session: AsyncSession | None = None,
         youtube_uploader: YouTubeUploader | None = None,
     ):
-        super().__init__(db_session)
         self.youtube_uploader = youtube_uploader or YouTubeUploader()
-        self._setup_skills()
-
-    def _setup_skills(self) -> None:
-        """Register skills for this agent."""
-        self.register_skill(UploadVideoSkill(self.youtube_uploader))
-        self.register_skill(GetVideoInfoSkill(self.youtube_uploader))
-        if self.db_session:
-            self.register_skill(SaveYouTubeUploadSkill(self.db_session))
+        # video_id -> (fetched_at, info); one lock per id so concurrent misses share a fetch
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self._info_locks: dict[str, asyncio.Lock] = {}
+        super().__init__(db_session)
 
     async def upload_video(
         self,
@@ -70,9 +76,24 @@ class YouTubeAgent(BaseAgent):
         return result.data if result.is_success else None
 
     async def get_video_info(self, video_id: str) -> dict | None:
-        """Get video information from YouTube."""
-        result = await self.execute_skill("get_video_info", video_id=video_id)
-        return result.data if result.is_success else None
+        """Get video information from YouTube, cached for settings.youtube_info_cache_ttl."""
+        cached = self._info_cache.get(video_id)
+        if cached and time.monotonic() - cached[0] < settings.youtube_info_cache_ttl:
+            return cached[1]
+
+        lock = self._info_locks.setdefault(video_id, asyncio.Lock())
+        async with lock:
+            # Another caller may have refilled the entry while we waited
+            cached = self._info_cache.get(video_id)
+            if cached and time.monotonic() - cached[0] < settings.youtube_info_cache_ttl:
+                return cached[1]
+
+            result = await self.execute_skill("get_video_info", video_id=video_id)
+            if not result.is_success:
+                return None
+            if result.data:
+                self._info_cache[video_id] = (time.monotonic(), result.data)
+            return result.data
 
     async def save_upload_record(
         self,
@@ -82,6 +103,7 @@ class YouTubeAgent(BaseAgent):
         title: str,
         video_generation_id: int | None = None,
         privacy_status: str = "public",
+        commit: bool = True,
     ) -> int | None:
         """Save upload record to database."""
         if not self.db_session:
@@ -95,6 +117,7 @@ class YouTubeAgent(BaseAgent):
             title=title,
             video_generation_id=video_generation_id,
             privacy_status=privacy_status,
+            commit=commit,
         )
         return result.data if result.is_success else None
 
@@ -107,6 +130,7 @@ class YouTubeAgent(BaseAgent):
         privacy_status: str = "public",
         story_id: int | None = None,
         video_generation_id: int | None = None,
+        commit: bool = True,
         **kwargs: Any,
     ) -> YouTubeAgentResult:
         """
@@ -120,12 +144,13 @@ class YouTubeAgent(BaseAgent):
             privacy_status: Privacy status (public, private, unlisted).
             story_id: Associated story ID for database tracking.
             video_generation_id: Associated video generation ID.
+            commit: Whether to commit the upload record; False leaves it to the caller.
 
         Returns:
             YouTubeAgentResult with upload details.
         """
         try:
-            print(f"[YouTubeAgent] Uploading video: {title}")
+            logger.info("[YouTubeAgent] Uploading video: %s", title)
 
             # Upload to YouTube
             upload_result = await self.upload_video(
@@ -137,12 +162,12 @@ class YouTubeAgent(BaseAgent):
             )
 
             if not upload_result:
-                return YouTubeAgentResult(
+                return YouTubeAgentResult.model_construct(
                     success=False,
                     error="Failed to upload video to YouTube",
                 )
 
-            print(f"[YouTubeAgent] Uploaded: {upload_result.url}")
+            logger.info("[YouTubeAgent] Uploaded: %s", upload_result.url)
 
             # Save to database
             upload_record_id = None
@@ -154,11 +179,17 @@ class YouTubeAgent(BaseAgent):
                     title=upload_result.title,
                     video_generation_id=video_generation_id,
                     privacy_status=privacy_status,
+                    commit=commit,
                 )
                 if upload_record_id:
-                    print(f"[YouTubeAgent] Saved upload record: {upload_record_id}")
-
-            return YouTubeAgentResult(
+                    logger.info("[YouTubeAgent] Saved upload record: %s", upload_record_id)
+                else:
+                    # The video is already on YouTube, so the upload itself still succeeded
+                    logger.warning(
+                        "[YouTubeAgent] Failed to save upload record for %s", upload_result.url
+                    )
+
+            return YouTubeAgentResult.model_construct(
                 video_id=upload_result.video_id,
                 video_url=upload_result.url,
                 upload_record_id=upload_record_id,
@@ -166,7 +197,7 @@ class YouTubeAgent(BaseAgent):
             )
 
         except Exception as e:
-            return YouTubeAgentResult(
+            return YouTubeAgentResult.model_construct(
                 success=False,
                 error=str(e),
             )
@@ -1,10 +1,27 @@
 """환경 변수 및 설정 관리"""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=1)
+def _find_character_image(character_dir: Path, _mtime_ns: int) -> Path | None:
+    """character/ 디렉토리의 첫 번째 이미지 (디렉토리 mtime이 바뀌면 다시 스캔)"""
+    for ext in ["png", "jpg", "jpeg", "webp"]:
+        images = list(character_dir.glob(f"*.{ext}"))
+        if images:
+            return images[0]
+    return None
+
+
+@lru_cache(maxsize=1)
+def _read_character_image(image_path: Path, _mtime_ns: int) -> bytes:
+    """캐릭터 이미지 바이트 (파일 mtime이 바뀌면 다시 읽음)"""
+    return image_path.read_bytes()
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
@@ -22,6 +39,7 @@ class Settings(BaseSettings):
     youtube_client_id: str = ""
     youtube_client_secret: str = ""
     youtube_refresh_token: str = ""
+    youtube_upload_chunk_size: int = 8 * 1024 * 1024  # 재개 가능 업로드 청크 크기 (256KiB 배수)
 
     # 캐릭터 설정
     main_character_name: str = "넝심이"
@@ -32,6 +50,11 @@ class Settings(BaseSettings):
     # Video Generation
     skip_video_generation: bool = False  # Veo3 영상 생성 스킵 (테스트용)
     test_video_path: str = ""  # 테스트용 영상 파일 경로
+    veo3_max_concurrency: int = 3  # 동시에 생성할 Veo3 세그먼트 수
+    veo3_max_retries: int = 2  # 세그먼트별 재시도 횟수 (429 등)
+    veo3_max_wait: int = 600  # Veo3 작업 완료를 기다리는 최대 시간 (초)
+    youtube_info_cache_ttl: int = 300  # YouTube 영상 정보 캐시 유지 시간 (초)
+    history_load_limit: int = 100  # 파일 모드에서 불러올 최근 히스토리 개수
 
     # PostgreSQL
     db_user: str = "postgres"
@@ -41,51 +64,76 @@ class Settings(BaseSettings):
     db_name: str = "ai_video_workflow"
     db_echo: bool = False
 
+    # 커넥션 풀 / asyncpg 튜닝
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800  # 초
+    db_pool_timeout: int = 5  # 초
+    db_pool_pre_ping: bool = True  # pgbouncer transaction 모드에서는 False 권장
+    db_statement_cache_size: int = 1024  # asyncpg 문장 캐시 (pgbouncer 사용 시 0)
+    db_prepared_statement_cache_size: int = 512  # SQLAlchemy asyncpg 어댑터 캐시
+    db_command_timeout: int = 30  # 초
+
     # 경로 설정 (환경변수로 설정하지 않음)
-    @property
+    @cached_property
     def project_root(self) -> Path:
         return Path(__file__).parent.parent
 
-    @property
+    @cached_property
     def character_dir(self) -> Path:
         return self.project_root / "character"
 
     @property
     def character_image_path(self) -> Path | None:
         """캐릭터 참조 이미지 경로 (character/ 디렉토리의 첫 번째 이미지)"""
-        if not self.character_dir.exists():
+        try:
+            mtime_ns = self.character_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
-        for ext in ["png", "jpg", "jpeg", "webp"]:
-            images = list(self.character_dir.glob(f"*.{ext}"))
-            if images:
-                return images[0]
-        return None
+        return _find_character_image(self.character_dir, mtime_ns)
 
     @property
+    def character_image_bytes(self) -> bytes | None:
+        """캐릭터 참조 이미지 내용 (프로세스당 한 번만 읽고 파일이 바뀌면 갱신)"""
+        image_path = self.character_image_path
+        if image_path is None:
+            return None
+        try:
+            mtime_ns = image_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return _read_character_image(image_path, mtime_ns)
+
+    @cached_property
     def data_dir(self) -> Path:
         return self.project_root / "data"
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         return self.project_root / "output" / "videos"
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         return self.project_root / "logs"
 
-    @property
+    @cached_property
+    def cache_dir(self) -> Path:
+        """로컬 캐시 디렉토리 (스키마 시그니처 등)"""
+        return Path.home() / ".cache" / "ai-video-workflow"
+
+    def ensure_dirs(self) -> None:
+        """데이터/출력/로그 디렉토리 생성 (import 시점이 아닌 실행 진입점에서 호출)"""
+        for path in (self.data_dir, self.output_dir, self.logs_dir):
+            path.mkdir(parents=True, exist_ok=True)
+
+    @cached_property
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
         return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
 
 # 전역 설정 인스턴스
 settings = Settings()
-
-# 디렉토리 생성
-settings.data_dir.mkdir(parents=True, exist_ok=True)
-settings.output_dir.mkdir(parents=True, exist_ok=True)
-settings.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -1,45 +1,93 @@
 """PostgreSQL 데이터베이스 연결 및 세션 관리"""
 
+import hashlib
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 
 from src.config import settings
 
-# 비동기 엔진 생성
-async_engine = create_async_engine(
-    settings.database_url,
-    echo=settings.db_echo,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
-
-# 동기 엔진 생성 (마이그레이션용)
-sync_engine = create_engine(
-    settings.sync_database_url,
-    echo=settings.db_echo,
-    pool_pre_ping=True,
-)
-
-# 세션 팩토리
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+# 엔진과 세션 팩토리는 프로세스당 하나만, 처음 사용할 때 생성
+_async_engine: AsyncEngine | None = None
+_sync_engine: Engine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 # Base 클래스
 Base = declarative_base()
 
 
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 반환 (최초 호출 시 생성)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.database_url,
+            echo=settings.db_echo,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=settings.db_pool_timeout,
+            connect_args={
+                # 짧은 OLTP 쿼리뿐이라 JIT 컴파일 비용만 듦
+                "server_settings": {"jit": "off"},
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+                "command_timeout": settings.db_command_timeout,
+            },
+        )
+    return _async_engine
+
+
+def get_sync_engine() -> Engine:
+    """동기 엔진 반환 (마이그레이션용, 최초 호출 시 생성)"""
+    global _sync_engine
+    if _sync_engine is None:
+        _sync_engine = create_engine(
+            settings.sync_database_url,
+            echo=settings.db_echo,
+            pool_pre_ping=True,
+        )
+    return _sync_engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 반환 (최초 호출 시 생성)"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_async_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            # 리포지토리는 INSERT/UPDATE ... RETURNING으로 바로 쓰므로 flush할 pending 객체가 없음
+            autoflush=False,
+        )
+    return _session_factory
+
+
+def __getattr__(name: str) -> Any:
+    # 기존 import 경로 호환 (from src.database import AsyncSessionLocal 등)
+    if name == "AsyncSessionLocal":
+        return get_session_factory()
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "sync_engine":
+        return get_sync_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """데이터베이스 세션 의존성"""
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -50,10 +98,69 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db() -> None:
     """데이터베이스 초기화 (테이블 생성)"""
-    async with async_engine.begin() as conn:
+    settings.ensure_dirs()
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all은 이미 있는 테이블에 새로 추가된 인덱스를 만들지 않음
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(sync_conn: Any) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+def schema_fingerprint() -> str:
+    """대상 DB와 테이블 정의로부터 스키마 시그니처 계산"""
+    digest = hashlib.sha256(f"{settings.db_host}:{settings.db_port}/{settings.db_name}".encode())
+    for table in Base.metadata.sorted_tables:
+        digest.update(repr(table).encode())
+        # Table repr에는 인덱스가 없으므로 따로 반영
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            digest.update(repr(index).encode())
+    return digest.hexdigest()
+
+
+async def _tables_exist() -> bool:
+    """모델의 테이블이 대상 DB에 모두 있는지 확인 (to_regclass 한 번 조회)"""
+    names = [table.name for table in Base.metadata.sorted_tables]
+    async with get_async_engine().connect() as conn:
+        missing = await conn.scalar(
+            text(
+                "SELECT count(*) FROM unnest(CAST(:names AS text[])) AS t(name) "
+                "WHERE to_regclass(t.name) IS NULL"
+            ),
+            {"names": names},
+        )
+    return missing == 0
+
+
+async def init_db_if_needed(force: bool = False) -> bool:
+    """스키마 시그니처가 바뀐 경우에만 init_db 실행 (실행 여부 반환)"""
+    sig_path = settings.cache_dir / "schema.sig"
+    fingerprint = schema_fingerprint()
+    if not force:
+        try:
+            # 같은 이름으로 DB를 다시 만든 경우도 있으므로 테이블이 실제로 있는지 함께 확인
+            if sig_path.read_text() == fingerprint and await _tables_exist():
+                return False
+        except OSError:
+            pass
+
+    await init_db()
+    try:
+        sig_path.parent.mkdir(parents=True, exist_ok=True)
+        sig_path.write_text(fingerprint)
+    except OSError:
+        pass
+    return True
 
 
 async def close_db() -> None:
     """데이터베이스 연결 종료"""
-    await async_engine.dispose()
+    global _async_engine, _session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _session_factory = None
@@ -1,11 +1,19 @@
 """데이터베이스 모델 정의"""
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from src.database import Base
 
 
+def _utcnow() -> datetime:
+    """Python 측 기본 타임스탬프 (server_default와 병행)"""
+    return datetime.now(UTC)
+
+
 class StoryHistory(Base):
     """스토리 히스토리 테이블"""
 
@@ -13,22 +21,30 @@ class StoryHistory(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     episode = Column(Integer, nullable=False, unique=True, index=True)
-    date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    date = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
 
     # 스토리 정보
     title = Column(String(500), nullable=False)
     dish = Column(String(200), nullable=False)
     summary = Column(Text, nullable=False)
     story = Column(Text, nullable=False)
-    cooking_steps = Column(JSON, nullable=False)  # 리스트로 저장
-    video_prompts = Column(JSON, nullable=False)  # 리스트로 저장
-    tags = Column(JSON, nullable=False)  # 리스트로 저장
+    cooking_steps = Column(JSONB, nullable=False)  # 리스트로 저장
+    video_prompts = Column(JSONB, nullable=False)  # 리스트로 저장
+    tags = Column(JSONB, nullable=False)  # 리스트로 저장
     description = Column(Text, nullable=False)
 
     # 메타데이터
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
@@ -36,6 +52,7 @@ class VideoGeneration(Base):
     """영상 생성 기록 테이블"""
 
     __tablename__ = "video_generations"
+    __table_args__ = (Index("ix_video_gen_story_status", "story_id", "status"),)
 
     id = Column(Integer, primary_key=True, index=True)
     story_id = Column(Integer, nullable=False, index=True)  # story_history.id 참조
@@ -46,15 +63,21 @@ class VideoGeneration(Base):
     status = Column(String(50), nullable=False)  # 'processing', 'completed', 'failed'
 
     # 세그먼트 정보
-    segments = Column(JSON, nullable=True)  # 세그먼트 정보 리스트
+    segments = Column(JSONB, nullable=True)  # 세그먼트 정보 리스트
 
     # 에러 정보
     error_message = Column(Text, nullable=True)
 
     # 메타데이터
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
@@ -80,9 +103,15 @@ class YouTubeUpload(Base):
     error_message = Column(Text, nullable=True)
 
     # 메타데이터
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
@@ -90,6 +119,10 @@ class WorkflowExecution(Base):
     """워크플로우 실행 기록 테이블"""
 
     __tablename__ = "workflow_executions"
+    __table_args__ = (
+        # 실행 중인 워크플로우만 담는 부분 인덱스
+        Index("ix_wf_running", "status", postgresql_where=text("status = 'running'")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     episode_number = Column(Integer, nullable=True, index=True)
@@ -107,6 +140,8 @@ class WorkflowExecution(Base):
     error_message = Column(Text, nullable=True)
 
     # 실행 시간
-    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     completed_at = Column(DateTime(timezone=True), nullable=True)
     duration_seconds = Column(Integer, nullable=True)
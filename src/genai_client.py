@@ -0,0 +1,20 @@
+"""프로세스 전체에서 공유하는 Google genai 클라이언트"""
+
+import atexit
+from functools import lru_cache
+
+from google import genai
+
+
+@lru_cache(maxsize=1)
+def shared_client(api_key: str) -> genai.Client:
+    """스토리(Gemini)와 영상(Veo3) 생성이 함께 쓰는 클라이언트 (HTTP keep-alive 커넥션 재사용)
+
+    genai.Client 생성은 네트워크 호출이 없으므로 잠금 없이 lru_cache로 한 번만 만든다.
+    """
+    client = genai.Client(api_key=api_key)
+    # close()는 google-genai 최신 버전에만 있음
+    close = getattr(client, "close", None)
+    if close is not None:
+        atexit.register(close)
+    return client
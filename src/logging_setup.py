@@ -0,0 +1,32 @@
+"""로깅 설정 (출력은 백그라운드 스레드에서 처리)"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """src.* 로거에 QueueHandler를 연결 (여러 번 호출해도 한 번만 설정)
+
+    이벤트 루프에서는 큐에 넣기만 하고, stdout 쓰기는 QueueListener 스레드가 담당한다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    # 라이브러리(httpx 등)의 INFO 로그는 섞이지 않도록 src 패키지 로거에만 연결
+    logger = logging.getLogger("src")
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
@@ -1,11 +1,13 @@
 """데이터 모델 정의"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Story(BaseModel):
     """스토리 데이터 모델"""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     dish: str
     summary: str
@@ -36,6 +38,8 @@ class StoryHistoryEntry(BaseModel):
 class VideoGenerationResult(BaseModel):
     """영상 생성 결과"""
 
+    model_config = ConfigDict(frozen=True)
+
     video_url: str | None = None
     operation_id: str | None = None
     status: str  # 'processing', 'completed', 'failed'
@@ -46,6 +50,8 @@ class VideoGenerationResult(BaseModel):
 class YouTubeUploadResult(BaseModel):
     """YouTube 업로드 결과"""
 
+    model_config = ConfigDict(frozen=True)
+
     video_id: str
     url: str
     title: str
@@ -1,8 +1,8 @@
 """데이터베이스 리포지토리 패턴"""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import DateTime, Integer, cast, desc, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db_models import StoryHistory, VideoGeneration, WorkflowExecution, YouTubeUpload
@@ -15,24 +15,41 @@ class StoryRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _values(story: Story, episode: int) -> dict:
+        return {
+            "episode": episode,
+            "date": datetime.now(),
+            "title": story.title,
+            "dish": story.dish,
+            "summary": story.summary,
+            "story": story.story,
+            "cooking_steps": story.cooking_steps,
+            "video_prompts": story.video_prompts,
+            "tags": story.tags,
+            "description": story.description,
+        }
+
     async def create(self, story: Story, episode: int) -> StoryHistory:
         """새 스토리 히스토리 생성"""
-        db_story = StoryHistory(
-            episode=episode,
-            date=datetime.now(),
-            title=story.title,
-            dish=story.dish,
-            summary=story.summary,
-            story=story.story,
-            cooking_steps=story.cooking_steps,
-            video_prompts=story.video_prompts,
-            tags=story.tags,
-            description=story.description,
+        # INSERT ... RETURNING: flush + refresh 없이 한 번의 왕복
+        result = await self.session.execute(
+            insert(StoryHistory).values(**self._values(story, episode)).returning(StoryHistory)
         )
-        self.session.add(db_story)
-        await self.session.flush()
-        await self.session.refresh(db_story)
-        return db_story
+        return result.scalar_one()
+
+    async def create_many(self, stories: list[Story], episodes: list[int]) -> list[int]:
+        """여러 스토리를 한 번에 생성하고 ID 목록을 반환 (백필용)"""
+        if not stories:
+            return []
+        result = await self.session.scalars(
+            insert(StoryHistory).returning(StoryHistory.id, sort_by_parameter_order=True),
+            [
+                self._values(story, episode)
+                for story, episode in zip(stories, episodes, strict=True)
+            ],
+        )
+        return list(result.all())
 
     async def get_by_episode(self, episode: int) -> StoryHistory | None:
         """에피소드 번호로 조회"""
@@ -59,8 +76,8 @@ class StoryRepository:
         return result.scalar() or 0
 
     def to_model(self, db_story: StoryHistory) -> StoryHistoryEntry:
-        """데이터베이스 모델을 Pydantic 모델로 변환"""
-        return StoryHistoryEntry(
+        """데이터베이스 모델을 Pydantic 모델로 변환 (DB 값은 신뢰하므로 검증 생략)"""
+        return StoryHistoryEntry.model_construct(
             episode=db_story.episode,
             date=db_story.date.isoformat(),
             title=db_story.title,
@@ -86,15 +103,25 @@ class VideoGenerationRepository:
         status: str = "processing",
         video_path: str | None = None,
         segments: list[dict] | None = None,
+        error_message: str | None = None,
     ) -> VideoGeneration:
         """새 영상 생성 기록 생성"""
-        db_video = VideoGeneration(
-            story_id=story_id, status=status, video_path=video_path, segments=segments or []
+        result = await self.session.execute(
+            insert(VideoGeneration)
+            .values(
+                story_id=story_id,
+                status=status,
+                video_path=video_path,
+                segments=segments or [],
+                error_message=error_message,
+            )
+            .returning(VideoGeneration)
         )
-        self.session.add(db_video)
-        await self.session.flush()
-        await self.session.refresh(db_video)
-        return db_video
+        return result.scalar_one()
+
+    async def get(self, video_id: int) -> VideoGeneration | None:
+        """ID로 조회 (identity map 우선)"""
+        return await self.session.get(VideoGeneration, video_id)
 
     async def update(
         self,
@@ -105,25 +132,27 @@ class VideoGenerationRepository:
         error_message: str | None = None,
     ) -> VideoGeneration | None:
         """영상 생성 기록 업데이트"""
+        values = {
+            key: value
+            for key, value in (
+                ("status", status),
+                ("video_path", video_path),
+                ("video_url", video_url),
+                ("error_message", error_message),
+            )
+            if value
+        }
+        if not values:
+            return await self.get(video_id)
+
+        # UPDATE ... RETURNING: 한 번의 왕복으로 갱신된 행을 받음
         result = await self.session.execute(
-            select(VideoGeneration).where(VideoGeneration.id == video_id)
+            update(VideoGeneration)
+            .where(VideoGeneration.id == video_id)
+            .values(**values)
+            .returning(VideoGeneration)
         )
-        db_video = result.scalar_one_or_none()
-
-        if db_video:
-            if status:
-                db_video.status = status
-            if video_path:
-                db_video.video_path = video_path
-            if video_url:
-                db_video.video_url = video_url
-            if error_message:
-                db_video.error_message = error_message
-
-            await self.session.flush()
-            await self.session.refresh(db_video)
-
-        return db_video
+        return result.scalar_one_or_none()
 
 
 class YouTubeUploadRepository:
@@ -142,19 +171,20 @@ class YouTubeUploadRepository:
         privacy_status: str = "public",
     ) -> YouTubeUpload:
         """새 YouTube 업로드 기록 생성"""
-        db_upload = YouTubeUpload(
-            story_id=story_id,
-            video_generation_id=video_generation_id,
-            video_id=video_id,
-            video_url=video_url,
-            title=title,
-            status="completed",
-            privacy_status=privacy_status,
+        result = await self.session.execute(
+            insert(YouTubeUpload)
+            .values(
+                story_id=story_id,
+                video_generation_id=video_generation_id,
+                video_id=video_id,
+                video_url=video_url,
+                title=title,
+                status="completed",
+                privacy_status=privacy_status,
+            )
+            .returning(YouTubeUpload)
         )
-        self.session.add(db_upload)
-        await self.session.flush()
-        await self.session.refresh(db_upload)
-        return db_upload
+        return result.scalar_one()
 
     async def get_by_video_id(self, video_id: str) -> YouTubeUpload | None:
         """YouTube video ID로 조회"""
@@ -174,11 +204,16 @@ class WorkflowExecutionRepository:
         self, episode_number: int | None = None, status: str = "running"
     ) -> WorkflowExecution:
         """새 워크플로우 실행 기록 생성"""
-        db_execution = WorkflowExecution(episode_number=episode_number, status=status)
-        self.session.add(db_execution)
-        await self.session.flush()
-        await self.session.refresh(db_execution)
-        return db_execution
+        result = await self.session.execute(
+            insert(WorkflowExecution)
+            .values(episode_number=episode_number, status=status)
+            .returning(WorkflowExecution)
+        )
+        return result.scalar_one()
+
+    async def get(self, execution_id: int) -> WorkflowExecution | None:
+        """ID로 조회 (identity map 우선)"""
+        return await self.session.get(WorkflowExecution, execution_id)
 
     async def update(
         self,
@@ -191,36 +226,33 @@ class WorkflowExecutionRepository:
         error_message: str | None = None,
     ) -> WorkflowExecution | None:
         """워크플로우 실행 기록 업데이트"""
+        values = {
+            key: value
+            for key, value in (
+                ("status", status),
+                ("current_step", current_step),
+                ("story_id", story_id),
+                ("video_generation_id", video_generation_id),
+                ("youtube_upload_id", youtube_upload_id),
+                ("error_message", error_message),
+            )
+            if value
+        }
+
+        if status in ["completed", "failed"]:
+            completed_at = datetime.now(UTC)
+            values["completed_at"] = completed_at
+            # 실행 시간은 DB의 started_at 기준으로 같은 UPDATE 안에서 계산
+            elapsed = literal(completed_at, DateTime(timezone=True)) - WorkflowExecution.started_at
+            values["duration_seconds"] = cast(func.extract("epoch", elapsed), Integer)
+
+        if not values:
+            return await self.get(execution_id)
+
         result = await self.session.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
+            update(WorkflowExecution)
+            .where(WorkflowExecution.id == execution_id)
+            .values(**values)
+            .returning(WorkflowExecution)
         )
-        db_execution = result.scalar_one_or_none()
-
-        if db_execution:
-            if status:
-                db_execution.status = status
-            if current_step:
-                db_execution.current_step = current_step
-            if story_id:
-                db_execution.story_id = story_id
-            if video_generation_id:
-                db_execution.video_generation_id = video_generation_id
-            if youtube_upload_id:
-                db_execution.youtube_upload_id = youtube_upload_id
-            if error_message:
-                db_execution.error_message = error_message
-
-            if status in ["completed", "failed"]:
-                db_execution.completed_at = datetime.now(timezone.utc)
-                if db_execution.started_at:
-                    # Handle timezone-aware/naive comparison
-                    started = db_execution.started_at
-                    if started.tzinfo is None:
-                        started = started.replace(tzinfo=timezone.utc)
-                    duration = (db_execution.completed_at - started).total_seconds()
-                    db_execution.duration_seconds = int(duration)
-
-            await self.session.flush()
-            await self.session.refresh(db_execution)
-
-        return db_execution
+        return result.scalar_one_or_none()
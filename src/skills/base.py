@@ -1,10 +1,14 @@
 """Base skill class for AI Video Workflow."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from enum import Enum
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class SkillStatus(str, Enum):
@@ -21,22 +25,21 @@ T = TypeVar("T")
 class SkillResult(BaseModel, Generic[T]):
     """Result of a skill execution."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     status: SkillStatus
     data: T | None = None
     error: str | None = None
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @classmethod
     def success(cls, data: T) -> "SkillResult[T]":
-        """Create a successful result."""
-        return cls(status=SkillStatus.SUCCESS, data=data)
+        """Create a successful result (data is built internally, so validation is skipped)."""
+        return cls.model_construct(status=SkillStatus.SUCCESS, data=data)
 
     @classmethod
     def failed(cls, error: str) -> "SkillResult[T]":
         """Create a failed result."""
-        return cls(status=SkillStatus.FAILED, error=error)
+        return cls.model_construct(status=SkillStatus.FAILED, error=error)
 
     @property
     def is_success(self) -> bool:
@@ -44,6 +47,26 @@ class SkillResult(BaseModel, Generic[T]):
         return self.status == SkillStatus.SUCCESS
 
 
+@asynccontextmanager
+async def write_scope(session: AsyncSession, commit: bool = True) -> AsyncIterator[None]:
+    """Transaction scope for a skill's database write.
+
+    With commit=True the write is committed on success and the session is rolled back
+    on error. With commit=False the write runs in a SAVEPOINT, so a failure only undoes
+    this write and leaves the caller's pending rows for it to commit.
+    """
+    if not commit:
+        async with session.begin_nested():
+            yield
+        return
+    try:
+        yield
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+
+
 class BaseSkill(ABC):
     """Base class for all skills."""
 
@@ -55,5 +78,9 @@ class BaseSkill(ABC):
         """Execute the skill."""
         pass
 
+    @cached_property
+    def _repr(self) -> str:
+        return f"<{type(self).__name__}(name={self.name})>"
+
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}(name={self.name})>"
+        return self._repr
@@ -1,19 +1,90 @@
 """Project management skills for AI Video Workflow."""
 
-import subprocess
-from datetime import datetime
-from typing import Any
-
-from pydantic import BaseModel
-from sqlalchemy import func, select
+import asyncio
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import BigInteger, case, cast, column, func, select, table
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.database import get_session_factory, init_db
 from src.db_models import StoryHistory, VideoGeneration, WorkflowExecution, YouTubeUpload
 from src.skills.base import BaseSkill, SkillResult
 
-
-class ProjectStatus(BaseModel):
+if TYPE_CHECKING:
+    from src.workflow import VideoWorkflowAgent
+
+
+# Below this many (estimated) rows an exact COUNT is cheap enough to run
+_EXACT_COUNT_THRESHOLD = 10_000
+
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+def _count_expr(model: Any, dialect_name: str) -> Any:
+    """Row count for a table: planner estimate on large Postgres tables, exact COUNT otherwise."""
+    exact = select(func.count(model.id)).scalar_subquery()
+    if dialect_name != "postgresql":
+        return exact
+
+    estimate = (
+        select(cast(_pg_class.c.reltuples, BigInteger))
+        # Match by oid so a same-named table in another schema cannot return a second row
+        .where(
+            _pg_class.c.oid
+            == func.to_regclass(f"{model.__table__.schema or 'public'}.{model.__tablename__}")
+        )
+        .scalar_subquery()
+    )
+    # reltuples is -1 for never-analyzed tables, which falls through to the exact count
+    return case((estimate >= _EXACT_COUNT_THRESHOLD, estimate), else_=exact)
+
+
+def _iter_old_files(directory: Path, suffix: str, cutoff_ts: float) -> Iterator[tuple[str, int]]:
+    """Yield (path, size) for regular files ending in suffix last modified before cutoff_ts."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(suffix) or not entry.is_file(follow_symlinks=False):
+                continue
+            # DirEntry caches the stat result, so mtime and size cost one syscall
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime < cutoff_ts:
+                yield entry.path, stat.st_size
+
+
+def _scan_and_delete(
+    directories: list[tuple[Path, str]], cutoff_ts: float, dry_run: bool
+) -> tuple[list[str], int]:
+    """Find (and unless dry_run, delete) old files; blocking, so run it off the event loop."""
+    deleted_files = []
+    total_size = 0
+    for directory, suffix in directories:
+        if not directory.exists():
+            continue
+        for path, size in _iter_old_files(directory, suffix, cutoff_ts):
+            if not dry_run:
+                os.unlink(path)
+            deleted_files.append(path)
+            total_size += size
+    return deleted_files, total_size
+
+
+@lru_cache(maxsize=1)
+def _workflow_agent_cls() -> type["VideoWorkflowAgent"]:
+    """Import the workflow (LangGraph plus every agent's client tree) on first use only."""
+    from src.workflow import VideoWorkflowAgent
+
+    return VideoWorkflowAgent
+
+
+@dataclass(slots=True)
+class ProjectStatus:
     """Project status information."""
 
     total_episodes: int = 0
@@ -22,10 +93,11 @@ class ProjectStatus(BaseModel):
     last_execution: str | None = None
     last_execution_status: str | None = None
     database_connected: bool = False
-    api_keys_configured: dict[str, bool] = {}
+    api_keys_configured: dict[str, bool] = field(default_factory=dict)
 
 
-class WorkflowRunResult(BaseModel):
+@dataclass(slots=True)
+class WorkflowRunResult:
     """Result of workflow execution."""
 
     success: bool
@@ -58,28 +130,31 @@ class CheckProjectStatusSkill(BaseSkill):
             # Check database if session available
             if self.db_session:
                 try:
-                    # Count stories
-                    result = await self.db_session.execute(select(func.count(StoryHistory.id)))
-                    status.total_episodes = result.scalar() or 0
-
-                    # Count videos
-                    result = await self.db_session.execute(select(func.count(VideoGeneration.id)))
-                    status.total_videos = result.scalar() or 0
-
-                    # Count uploads
-                    result = await self.db_session.execute(select(func.count(YouTubeUpload.id)))
-                    status.total_uploads = result.scalar() or 0
-
-                    # Last execution
-                    result = await self.db_session.execute(
-                        select(WorkflowExecution)
+                    # Counts and the last execution in a single round trip; cheaper than
+                    # gathering separate queries, which would each need their own session
+                    last_exec = (
+                        select(WorkflowExecution.started_at, WorkflowExecution.status)
                         .order_by(WorkflowExecution.started_at.desc())
                         .limit(1)
+                        .subquery()
+                    )
+                    dialect_name = self.db_session.get_bind().dialect.name
+                    result = await self.db_session.execute(
+                        select(
+                            _count_expr(StoryHistory, dialect_name),
+                            _count_expr(VideoGeneration, dialect_name),
+                            _count_expr(YouTubeUpload, dialect_name),
+                            select(last_exec.c.started_at).scalar_subquery(),
+                            select(last_exec.c.status).scalar_subquery(),
+                        )
                     )
-                    last_exec = result.scalar_one_or_none()
-                    if last_exec:
-                        status.last_execution = last_exec.started_at.isoformat()
-                        status.last_execution_status = last_exec.status
+                    stories, videos, uploads, last_started_at, last_status = result.one()
+                    status.total_episodes = stories or 0
+                    status.total_videos = videos or 0
+                    status.total_uploads = uploads or 0
+                    if last_started_at:
+                        status.last_execution = last_started_at.isoformat()
+                        status.last_execution_status = last_status
 
                     status.database_connected = True
                 except Exception:
@@ -104,16 +179,14 @@ class RunWorkflowSkill(BaseSkill):
     ) -> SkillResult[WorkflowRunResult]:
         """Run the workflow for a specific episode."""
         try:
-            from src.database import AsyncSessionLocal
-            from src.workflow import VideoWorkflowAgent
-
-            start_time = datetime.now()
+            workflow_agent_cls = _workflow_agent_cls()
+            start_time = time.perf_counter()
 
-            async with AsyncSessionLocal() as session:
-                agent = VideoWorkflowAgent(db_session=session)
+            async with get_session_factory()() as session:
+                agent = workflow_agent_cls(db_session=session)
                 result = await agent.run(episode_number=episode, private=private)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             if result.error:
                 return SkillResult.success(
@@ -128,7 +201,7 @@ class RunWorkflowSkill(BaseSkill):
             return SkillResult.success(
                 WorkflowRunResult(
                     success=True,
-                    episode=len(result.story_history) if result.story_history else episode,
+                    episode=result.story.episode if result.story else episode,
                     video_url=result.upload_result.url if result.upload_result else None,
                     duration_seconds=duration,
                 )
@@ -153,22 +226,30 @@ class ViewHistorySkill(BaseSkill):
     ) -> SkillResult[list[dict]]:
         """View recent history."""
         try:
-            result = await self.db_session.execute(
-                select(StoryHistory).order_by(StoryHistory.created_at.desc()).limit(limit)
-            )
-            stories = result.scalars().all()
-
-            history = []
-            for story in stories:
-                history.append(
-                    {
-                        "episode": story.episode,
-                        "title": story.title,
-                        "dish": story.dish,
-                        "date": story.date,
-                        "created_at": story.created_at.isoformat() if story.created_at else None,
-                    }
+            # Only the columns shown in the listing (skips the long story/description text)
+            stmt = (
+                select(
+                    StoryHistory.episode,
+                    StoryHistory.title,
+                    StoryHistory.dish,
+                    StoryHistory.date,
+                    StoryHistory.created_at,
                 )
+                .order_by(StoryHistory.created_at.desc())
+                .limit(limit)
+            )
+            rows = await self.db_session.execute(stmt)
+
+            history = [
+                {
+                    "episode": row.episode,
+                    "title": row.title,
+                    "dish": row.dish,
+                    "date": row.date,
+                    "created_at": row.created_at.isoformat() if row.created_at else None,
+                }
+                for row in rows  # iterate the buffered result directly, no .all() copy
+            ]
 
             return SkillResult.success(history)
         except Exception as e:
@@ -196,17 +277,19 @@ class RunDatabaseMigrationSkill(BaseSkill):
             if action in ("upgrade", "downgrade"):
                 cmd.append(revision)
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
+            # Run alembic as an async subprocess so the event loop is not blocked while it runs
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=settings.data_dir.parent,
             )
+            stdout, stderr = await proc.communicate()
 
-            if result.returncode != 0:
-                return SkillResult.failed(f"Migration failed: {result.stderr}")
+            if proc.returncode != 0:
+                return SkillResult.failed(f"Migration failed: {stderr.decode()}")
 
-            return SkillResult.success(result.stdout or "Migration completed successfully")
+            return SkillResult.success(stdout.decode() or "Migration completed successfully")
         except Exception as e:
             return SkillResult.failed(f"Migration error: {e}")
 
@@ -225,33 +308,13 @@ class CleanupFilesSkill(BaseSkill):
     ) -> SkillResult[dict]:
         """Clean up old files."""
         try:
-            from datetime import timedelta
-
-            cutoff = datetime.now() - timedelta(days=older_than_days)
-            deleted_files = []
-            total_size = 0
-
-            # Clean video files
-            video_dir = settings.output_dir / "videos"
-            if video_dir.exists():
-                for file in video_dir.glob("*.mp4"):
-                    if datetime.fromtimestamp(file.stat().st_mtime) < cutoff:
-                        size = file.stat().st_size
-                        if not dry_run:
-                            file.unlink()
-                        deleted_files.append(str(file))
-                        total_size += size
-
-            # Clean log files
-            log_dir = settings.logs_dir
-            if log_dir.exists():
-                for file in log_dir.glob("*.log"):
-                    if datetime.fromtimestamp(file.stat().st_mtime) < cutoff:
-                        size = file.stat().st_size
-                        if not dry_run:
-                            file.unlink()
-                        deleted_files.append(str(file))
-                        total_size += size
+            cutoff_ts = time.time() - older_than_days * 86400
+
+            # Clean video files, then log files
+            directories = [(settings.output_dir / "videos", ".mp4"), (settings.logs_dir, ".log")]
+            deleted_files, total_size = await asyncio.to_thread(
+                _scan_and_delete, directories, cutoff_ts, dry_run
+            )
 
             return SkillResult.success(
                 {
@@ -274,8 +337,6 @@ class InitializeDatabaseSkill(BaseSkill):
     async def execute(self, **kwargs: Any) -> SkillResult[str]:
         """Initialize the database."""
         try:
-            from src.database import init_db
-
             await init_db()
             return SkillResult.success("Database initialized successfully")
         except Exception as e:
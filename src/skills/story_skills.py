@@ -1,13 +1,25 @@
 """Story-related skills for AI Video Workflow."""
 
-from typing import Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import Story, StoryHistoryEntry
 from src.repository import StoryRepository
-from src.skills.base import BaseSkill, SkillResult
-from src.story_generator import GeminiStoryGenerator
+from src.skills.base import BaseSkill, SkillResult, write_scope
+
+if TYPE_CHECKING:
+    from src.story_generator import GeminiStoryGenerator
+
+
+@lru_cache(maxsize=1)
+def _default_story_generator() -> "GeminiStoryGenerator":
+    """Process-wide default generator, shared by skills built without one."""
+    from src.story_generator import GeminiStoryGenerator
+
+    return GeminiStoryGenerator()
 
 
 class GenerateStorySkill(BaseSkill):
@@ -16,8 +28,20 @@ class GenerateStorySkill(BaseSkill):
     name = "generate_story"
     description = "Generate a cooking story for an episode using Gemini API"
 
-    def __init__(self, story_generator: GeminiStoryGenerator | None = None):
-        self.story_generator = story_generator or GeminiStoryGenerator()
+    def __init__(
+        self,
+        story_generator: "GeminiStoryGenerator | None" = None,
+        story_generator_factory: "Callable[[], GeminiStoryGenerator] | None" = None,
+    ):
+        self._story_generator = story_generator
+        self._story_generator_factory = story_generator_factory or _default_story_generator
+
+    @property
+    def story_generator(self) -> "GeminiStoryGenerator":
+        """Story generator, created on first use (Gemini client init is deferred)."""
+        if self._story_generator is None:
+            self._story_generator = self._story_generator_factory()
+        return self._story_generator
 
     async def execute(
         self,
@@ -73,14 +97,14 @@ class SaveStorySkill(BaseSkill):
         self,
         story: Story,
         episode: int,
+        commit: bool = True,
         **kwargs: Any,
     ) -> SkillResult[int]:
-        """Save a story and return its ID."""
+        """Save a story and return its ID (commit=False leaves it to the caller)."""
         try:
             repo = StoryRepository(self.db_session)
-            db_story = await repo.create(story, episode)
-            await self.db_session.commit()
+            async with write_scope(self.db_session, commit):
+                db_story = await repo.create(story, episode)
             return SkillResult.success(db_story.id)
         except Exception as e:
-            await self.db_session.rollback()
             return SkillResult.failed(f"Failed to save story: {e}")
@@ -1,24 +1,52 @@
 """Video-related skills for AI Video Workflow."""
 
-from typing import Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import VideoGenerationResult
 from src.repository import VideoGenerationRepository
-from src.skills.base import BaseSkill, SkillResult
-from src.video_generator import Veo3VideoGenerator
+from src.skills.base import BaseSkill, SkillResult, write_scope
 
+if TYPE_CHECKING:
+    from src.video_generator import Veo3VideoGenerator
 
-class GenerateVideoSkill(BaseSkill):
+
+@lru_cache(maxsize=1)
+def _default_video_generator() -> "Veo3VideoGenerator":
+    """Process-wide default generator, shared by skills built without one."""
+    from src.video_generator import Veo3VideoGenerator
+
+    return Veo3VideoGenerator()
+
+
+class _VideoGeneratorSkill(BaseSkill):
+    """Base for skills backed by a Veo3 generator that is created on first use."""
+
+    def __init__(
+        self,
+        video_generator: "Veo3VideoGenerator | None" = None,
+        video_generator_factory: "Callable[[], Veo3VideoGenerator] | None" = None,
+    ):
+        self._video_generator = video_generator
+        self._video_generator_factory = video_generator_factory or _default_video_generator
+
+    @property
+    def video_generator(self) -> "Veo3VideoGenerator":
+        """Video generator, created on first use (Veo3 client init is deferred)."""
+        if self._video_generator is None:
+            self._video_generator = self._video_generator_factory()
+        return self._video_generator
+
+
+class GenerateVideoSkill(_VideoGeneratorSkill):
     """Skill to generate a video using Veo3 API."""
 
     name = "generate_video"
     description = "Generate a video from a text prompt using Veo3 API"
 
-    def __init__(self, video_generator: Veo3VideoGenerator | None = None):
-        self.video_generator = video_generator or Veo3VideoGenerator()
-
     async def execute(
         self,
         prompt: str,
@@ -38,15 +66,12 @@ class GenerateVideoSkill(BaseSkill):
             return SkillResult.failed(f"Video generation failed: {e}")
 
 
-class GenerateVideoSequenceSkill(BaseSkill):
+class GenerateVideoSequenceSkill(_VideoGeneratorSkill):
     """Skill to generate a sequence of videos from multiple prompts."""
 
     name = "generate_video_sequence"
     description = "Generate multiple videos from prompts and merge them"
 
-    def __init__(self, video_generator: Veo3VideoGenerator | None = None):
-        self.video_generator = video_generator or Veo3VideoGenerator()
-
     async def execute(
         self,
         prompts: list[str],
@@ -66,15 +91,12 @@ class GenerateVideoSequenceSkill(BaseSkill):
             return SkillResult.failed(f"Video sequence generation failed: {e}")
 
 
-class MergeVideosSkill(BaseSkill):
+class MergeVideosSkill(_VideoGeneratorSkill):
     """Skill to merge multiple videos into one."""
 
     name = "merge_videos"
     description = "Merge multiple video files into a single video"
 
-    def __init__(self, video_generator: Veo3VideoGenerator | None = None):
-        self.video_generator = video_generator or Veo3VideoGenerator()
-
     async def execute(
         self,
         video_paths: list[str],
@@ -107,21 +129,23 @@ class SaveVideoGenerationSkill(BaseSkill):
         status: str = "processing",
         video_path: str | None = None,
         segments: list[dict] | None = None,
+        error_message: str | None = None,
+        commit: bool = True,
         **kwargs: Any,
     ) -> SkillResult[int]:
-        """Save a video generation record."""
+        """Save a video generation record (commit=False leaves it to the caller)."""
         try:
             repo = VideoGenerationRepository(self.db_session)
-            db_video = await repo.create(
-                story_id=story_id,
-                status=status,
-                video_path=video_path,
-                segments=segments,
-            )
-            await self.db_session.commit()
+            async with write_scope(self.db_session, commit):
+                db_video = await repo.create(
+                    story_id=story_id,
+                    status=status,
+                    video_path=video_path,
+                    segments=segments,
+                    error_message=error_message,
+                )
             return SkillResult.success(db_video.id)
         except Exception as e:
-            await self.db_session.rollback()
             return SkillResult.failed(f"Failed to save video generation: {e}")
 
 
@@ -140,19 +164,19 @@ class UpdateVideoGenerationSkill(BaseSkill):
         status: str | None = None,
         video_path: str | None = None,
         error_message: str | None = None,
+        commit: bool = True,
         **kwargs: Any,
     ) -> SkillResult[bool]:
-        """Update a video generation record."""
+        """Update a video generation record (commit=False leaves it to the caller)."""
         try:
             repo = VideoGenerationRepository(self.db_session)
-            await repo.update(
-                video_id=video_id,
-                status=status,
-                video_path=video_path,
-                error_message=error_message,
-            )
-            await self.db_session.commit()
+            async with write_scope(self.db_session, commit):
+                await repo.update(
+                    video_id=video_id,
+                    status=status,
+                    video_path=video_path,
+                    error_message=error_message,
+                )
             return SkillResult.success(True)
         except Exception as e:
-            await self.db_session.rollback()
             return SkillResult.failed(f"Failed to update video generation: {e}")
@@ -1,15 +1,22 @@
 """YouTube 관련 스킬"""
 
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import YouTubeUploadResult
 from src.repository import YouTubeUploadRepository
-from src.skills.base import BaseSkill, SkillResult
+from src.skills.base import BaseSkill, SkillResult, write_scope
 from src.youtube_uploader import YouTubeUploader
 
 
+@lru_cache(maxsize=1)
+def _default_uploader() -> YouTubeUploader:
+    """업로더 없이 생성된 스킬들이 공유하는 기본 업로더"""
+    return YouTubeUploader()
+
+
 class UploadVideoSkill(BaseSkill):
     """YouTube 영상 업로드 스킬"""
 
@@ -17,7 +24,7 @@ class UploadVideoSkill(BaseSkill):
     description = "Upload a video to YouTube"
 
     def __init__(self, uploader: YouTubeUploader | None = None):
-        self.uploader = uploader or YouTubeUploader()
+        self.uploader = uploader or _default_uploader()
 
     async def execute(
         self,
@@ -50,7 +57,7 @@ class GetVideoInfoSkill(BaseSkill):
     description = "Get video information from YouTube"
 
     def __init__(self, uploader: YouTubeUploader | None = None):
-        self.uploader = uploader or YouTubeUploader()
+        self.uploader = uploader or _default_uploader()
 
     async def execute(self, video_id: str, **kwargs: Any) -> SkillResult[dict]:
         """YouTube 영상 정보 조회"""
@@ -78,21 +85,21 @@ class SaveYouTubeUploadSkill(BaseSkill):
         title: str,
         video_generation_id: int | None = None,
         privacy_status: str = "public",
+        commit: bool = True,
         **kwargs: Any,
     ) -> SkillResult[int]:
-        """업로드 기록 저장"""
+        """업로드 기록 저장 (commit=False면 커밋은 호출자에게 맡김)"""
         try:
             repo = YouTubeUploadRepository(self.db_session)
-            record = await repo.create(
-                story_id=story_id,
-                video_id=video_id,
-                video_url=video_url,
-                title=title,
-                video_generation_id=video_generation_id,
-                privacy_status=privacy_status,
-            )
-            await self.db_session.commit()
+            async with write_scope(self.db_session, commit):
+                record = await repo.create(
+                    story_id=story_id,
+                    video_id=video_id,
+                    video_url=video_url,
+                    title=title,
+                    video_generation_id=video_generation_id,
+                    privacy_status=privacy_status,
+                )
             return SkillResult.success(record.id)
         except Exception as e:
-            await self.db_session.rollback()
             return SkillResult.failed(f"Failed to save upload record: {e}")
@@ -1,70 +1,20 @@
 """Gemini API를 사용한 스토리 생성"""
 
-import json
-import re
+import logging
 from datetime import datetime
 
-from google import genai
-
 from src.config import settings
+from src.genai_client import shared_client
 from src.models import Story, StoryHistoryEntry
 
+logger = logging.getLogger(__name__)
 
-class GeminiStoryGenerator:
-    """Gemini API를 사용하여 요리 영상 스토리를 생성하는 클래스"""
-
-    def __init__(self):
-        if not settings.google_api_key:
-            raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
-
-        self.client = genai.Client(api_key=settings.google_api_key)
-        self.model_name = "gemini-2.0-flash"
-        self.story_history: list[StoryHistoryEntry] = []
-
-    def load_story_history(self, history: list[dict]) -> None:
-        """이전 스토리 히스토리를 로드합니다"""
-        self.story_history = [
-            StoryHistoryEntry(**entry) if isinstance(entry, dict) else entry for entry in history
-        ]
-
-    def get_story_history(self) -> list[StoryHistoryEntry]:
-        """스토리 히스토리를 반환합니다"""
-        return self.story_history
-
-    def build_prompt(self, episode: int) -> str:
-        """프롬프트를 구성합니다"""
-        history_context = ""
-        if self.story_history:
-            recent_episodes = self.story_history[-10:]  # 최근 10개까지 확인
-
-            # 이전에 만든 요리 목록
-            previous_dishes = [h.dish for h in self.story_history]
-            dishes_list = ", ".join(previous_dishes) if previous_dishes else "없음"
-
-            # 에피소드별 상세 정보
-            episode_details = "\n".join(
-                f"- 에피소드 {h.episode}: [{h.dish}] {h.title} - {h.summary}"
-                for h in recent_episodes
-            )
-
-            history_context = f"""
-
-=== 이전 콘텐츠 기록 (DB 조회 결과) ===
-
-지금까지 만든 요리 목록 (중복 금지):
-{dishes_list}
-
-최근 에피소드 상세:
-{episode_details}
-
-중요: 위 요리들과 중복되지 않는 새로운 요리를 선택하세요!
-==================================="""
-
-        return f"""당신은 귀여운 라쿤 캐릭터 "넝심이"의 요리 쇼츠 영상을 위한 스토리를 작성하는 작가입니다.
+# 프롬프트 템플릿 (캐릭터 설정은 생성기당 한 번, 히스토리는 바뀔 때만 채움)
+_PROMPT_PREFIX = """당신은 귀여운 라쿤 캐릭터 "넝심이"의 요리 쇼츠 영상을 위한 스토리를 작성하는 작가입니다.
 
 캐릭터 정보:
-- 주인공: {settings.main_character_name} - {settings.main_character_description}
-- 조연: {settings.supporting_character_name} - {settings.supporting_character_description}
+- 주인공: {main_name} - {main_description}
+- 조연: {supporting_name} - {supporting_description}
 
 요구사항:
 1. 요리 영상이 메인 콘텐츠입니다
@@ -73,9 +23,9 @@ class GeminiStoryGenerator:
 4. 쇼츠 영상(60초 이내)에 적합한 분량입니다
 5. 시청자들이 즐겁게 볼 수 있는 가벼운 톤입니다
 
-{history_context}
+"""
 
-에피소드 {episode}를 위한 스토리를 생성해주세요. 다음 JSON 형식으로 응답해주세요:
+_PROMPT_SUFFIX = """를 위한 스토리를 생성해주세요. 다음 JSON 형식으로 응답해주세요:
 
 {{
   "title": "영상 제목",
@@ -92,55 +42,149 @@ class GeminiStoryGenerator:
   "description": "YouTube 설명란용 텍스트"
 }}
 
-스토리는 요리 과정과 자연스럽게 연결되어야 하며, {settings.main_character_name}와 {settings.supporting_character_name}의 캐릭터가 일관되게 유지되어야 합니다."""
+스토리는 요리 과정과 자연스럽게 연결되어야 하며, {main_name}와 {supporting_name}의 캐릭터가 일관되게 유지되어야 합니다."""
+
+_HISTORY_TEMPLATE = """
+
+=== 이전 콘텐츠 기록 (DB 조회 결과) ===
+
+지금까지 만든 요리 목록 (중복 금지):
+{dishes_list}
+
+최근 에피소드 상세:
+{episode_details}
+
+중요: 위 요리들과 중복되지 않는 새로운 요리를 선택하세요!
+==================================="""
+
+
+class GeminiStoryGenerator:
+    """Gemini API를 사용하여 요리 영상 스토리를 생성하는 클래스"""
+
+    def __init__(self):
+        if not settings.google_api_key:
+            raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
+
+        self.client = shared_client(settings.google_api_key)
+        self.model_name = "gemini-2.0-flash"
+        self.story_history: list[StoryHistoryEntry] = []
+        # 히스토리에 추가될 때마다 갱신되는 요리 목록과 (히스토리 길이, 히스토리 블록) 캐시
+        self._dishes: list[str] = []
+        self._history_block: tuple[int, str] | None = None
+        self._prompt_prefix, self._prompt_suffix = self._build_static_prompt()
+        # 응답 파싱 실패 시 사용하는 기본 스토리 값 (설정에만 의존하므로 한 번만 구성)
+        name = settings.main_character_name
+        self._fallback_video_prompts = (
+            f"{name}가 요리를 준비하는 모습",
+            f"{name}가 요리하는 모습",
+            f"{name}가 완성된 요리를 보여주는 모습",
+        )
+        self._fallback_tags = ("요리", "라쿤", "쇼츠")
+
+    @staticmethod
+    def _build_static_prompt() -> tuple[str, str]:
+        """설정에만 의존하는 프롬프트 앞/뒤 부분을 한 번만 구성합니다"""
+        characters = {
+            "main_name": settings.main_character_name,
+            "main_description": settings.main_character_description,
+            "supporting_name": settings.supporting_character_name,
+            "supporting_description": settings.supporting_character_description,
+        }
+        return _PROMPT_PREFIX.format(**characters), _PROMPT_SUFFIX.format(**characters)
+
+    def load_story_history(self, history: list[dict]) -> None:
+        """이전 스토리 히스토리를 로드합니다"""
+        self.story_history = [
+            # DB에서 온 신뢰할 수 있는 데이터이므로 검증 생략
+            StoryHistoryEntry.model_construct(**entry) if isinstance(entry, dict) else entry
+            for entry in history
+        ]
+        self._dishes = [h.dish for h in self.story_history]
+        self._history_block = None
+
+    def get_story_history(self) -> list[StoryHistoryEntry]:
+        """스토리 히스토리를 반환합니다"""
+        return self.story_history
+
+    def _history_context(self) -> str:
+        """이전 콘텐츠 기록 블록 (히스토리 길이가 바뀔 때만 다시 구성)"""
+        if not self.story_history:
+            return ""
+        if self._history_block and self._history_block[0] == len(self.story_history):
+            return self._history_block[1]
+
+        recent_episodes = self.story_history[-10:]  # 최근 10개까지 확인
+
+        # 이전에 만든 요리 목록
+        dishes_list = ", ".join(self._dishes) if self._dishes else "없음"
+
+        # 에피소드별 상세 정보
+        episode_details = "\n".join(
+            f"- 에피소드 {h.episode}: [{h.dish}] {h.title} - {h.summary}" for h in recent_episodes
+        )
+
+        history_context = _HISTORY_TEMPLATE.format(
+            dishes_list=dishes_list, episode_details=episode_details
+        )
+        self._history_block = (len(self.story_history), history_context)
+        return history_context
+
+    def build_prompt(self, episode: int) -> str:
+        """프롬프트를 구성합니다"""
+        return (
+            f"{self._prompt_prefix}{self._history_context()}\n\n"
+            f"에피소드 {episode}{self._prompt_suffix}"
+        )
 
-    def parse_story_response(self, text: str, episode: int) -> Story:
-        """응답을 파싱합니다"""
+    def parse_story_response(self, text: str, episode: int, now_iso: str | None = None) -> Story:
+        """응답을 파싱합니다 (now_iso: 스토리 날짜, 없으면 현재 시각)"""
+        now_iso = now_iso or datetime.now().isoformat()
         try:
-            # JSON 부분만 추출
-            json_match = re.search(r"\{[\s\S]*\}", text)
-            if json_match:
-                story_data = json.loads(json_match.group(0))
-                return Story(**story_data, episode=episode, date=datetime.now().isoformat())
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"응답 파싱 오류: {e}")
-
-        # 기본값 반환
-        return Story(
+            # JSON 부분만 추출 (첫 '{'부터 마지막 '}'까지)
+            start = text.find("{")
+            end = text.rfind("}") + 1
+            if start != -1 and end > start:
+                # 디코딩과 검증을 한 번에 처리 (pydantic-core JSON 파서)
+                story = Story.model_validate_json(text[start:end])
+                return story.model_copy(update={"episode": episode, "date": now_iso})
+        except Exception as e:
+            logger.warning("응답 파싱 오류: %s", e)
+
+        # 기본값 반환 (고정값과 응답 텍스트뿐이므로 검증 생략)
+        truncated = text[:500] if text else ""
+        return Story.model_construct(
             title=f"넝심이의 요리 - 에피소드 {episode}",
             dish="특별한 요리",
             summary="넝심이가 요리를 만드는 귀여운 영상",
-            story=text[:500] if text else "넝심이가 요리를 만드는 스토리",
+            story=truncated or "넝심이가 요리를 만드는 스토리",
             cooking_steps=["준비", "요리", "완성"],
-            video_prompts=[
-                f"{settings.main_character_name}가 요리를 준비하는 모습",
-                f"{settings.main_character_name}가 요리하는 모습",
-                f"{settings.main_character_name}가 완성된 요리를 보여주는 모습",
-            ],
-            tags=["요리", "라쿤", "쇼츠"],
-            description=text[:500] if text else "넝심이의 요리 영상",
+            video_prompts=list(self._fallback_video_prompts),
+            tags=list(self._fallback_tags),
+            description=truncated or "넝심이의 요리 영상",
             episode=episode,
-            date=datetime.now().isoformat(),
+            date=now_iso,
         )
 
     async def generate_story(self, episode_number: int | None = None) -> Story:
         """새로운 요리 영상 스토리를 생성합니다"""
         episode = episode_number or len(self.story_history) + 1
         prompt = self.build_prompt(episode)
+        now_iso = datetime.now().isoformat()
 
         try:
-            response = self.client.models.generate_content(
+            # 비동기 클라이언트로 호출해 응답을 기다리는 동안 이벤트 루프를 막지 않음
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
             )
             text = response.text
 
-            story = self.parse_story_response(text, episode)
+            story = self.parse_story_response(text, episode, now_iso)
 
-            # 히스토리에 추가
-            history_entry = StoryHistoryEntry(
+            # 히스토리에 추가 (이미 검증된 Story에서 만들므로 검증 생략)
+            history_entry = StoryHistoryEntry.model_construct(
                 episode=story.episode,
-                date=story.date or datetime.now().isoformat(),
+                date=story.date or now_iso,
                 title=story.title,
                 dish=story.dish,
                 summary=story.summary,
@@ -151,8 +195,9 @@ class GeminiStoryGenerator:
                 description=story.description,
             )
             self.story_history.append(history_entry)
+            self._dishes.append(history_entry.dish)
 
             return story
         except Exception as error:
-            print(f"스토리 생성 중 오류: {error}")
+            logger.exception("스토리 생성 중 오류: %s", error)
             raise
@@ -1,14 +1,199 @@
 """Google Veo3 API를 사용한 영상 생성"""
 
 import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import mimetypes
+import os
+import random
+import subprocess
+import tempfile
 import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
-from google import genai
 from google.genai import types
 
 from src.config import settings
+from src.genai_client import shared_client
 from src.models import VideoGenerationResult
 
+logger = logging.getLogger(__name__)
+
+# ffmpeg 실패 시 오류 메시지에 남길 stderr 마지막 줄 수
+_FFMPEG_STDERR_TAIL = 200
+
+# 같은 입력으로 만든 세그먼트 재사용 목록 파일 (output_dir 아래)
+_SEGMENT_INDEX_NAME = ".veo3_cache.json"
+
+# 같은 시각에 생성된 파일명 충돌 방지용 카운터
+_filename_counter = itertools.count()
+
+
+def _unique_filename(prefix: str) -> str:
+    return f"{prefix}_{time.time_ns()}_{next(_filename_counter)}.mp4"
+
+
+def _indexed_segment_paths(output_dir: Path) -> set[str]:
+    """재사용 목록에 기록된 세그먼트 경로 (목록을 읽을 수 없으면 빈 집합)"""
+    try:
+        index = json.loads((output_dir / _SEGMENT_INDEX_NAME).read_text())
+        return {entry["path"] for entry in index.values()}
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        return set()
+
+
+def _sweep_orphan_segments(output_dir: Path, since: float) -> None:
+    """since 이후 내려받았지만 재사용 목록에 없는 세그먼트(veo3_*.mp4) 삭제"""
+    indexed = _indexed_segment_paths(output_dir)
+    for path in output_dir.glob("veo3_*.mp4"):
+        try:
+            if path.stat().st_mtime >= since and str(path) not in indexed:
+                path.unlink()
+                logger.info("남은 세그먼트 삭제: %s", path)
+        except OSError as error:
+            logger.debug("세그먼트 삭제 실패 (%s): %s", path, error)
+
+
+@lru_cache(maxsize=64)
+def _prompt_suffix(style: str, aspect_ratio: str, negative_prompt: str) -> str:
+    """프롬프트 뒤에 붙는 고정 부분 (스타일 조합마다 한 번만 구성)"""
+    return (
+        f", {style}, high quality, cute raccoon character, "
+        f"cooking video, shorts format, {aspect_ratio} aspect ratio, "
+        f"no dialogue, no speech, no narration, sound effects only, ambient cooking sounds, "
+        f"avoid: {negative_prompt}"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _VideoProbe:
+    """ffprobe로 확인한 세그먼트 스트림 정보"""
+
+    video: tuple  # (codec_name, width, height, r_frame_rate, time_base)
+    audio: tuple | None  # (codec_name, sample_rate, channels), 오디오가 없으면 None
+    duration: float
+
+
+# (경로, mtime) -> 스트림 정보 (워크플로우 재시도 시 같은 세그먼트를 다시 확인하지 않음)
+_probe_cache: dict[tuple[str, int], _VideoProbe] = {}
+
+
+async def _probe_video(path: str) -> _VideoProbe:
+    """ffprobe로 영상/오디오 스트림 정보를 확인합니다"""
+    key = (path, os.stat(path).st_mtime_ns)
+    cached = _probe_cache.get(key)
+    if cached is not None:
+        return cached
+
+    proc = await asyncio.create_subprocess_exec(
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,width,height,r_frame_rate,time_base,sample_rate,channels"
+        ":format=duration",
+        "-of",
+        "json",
+        path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffprobe 실패 ({path}): {stderr.decode()}")
+
+    info = json.loads(stdout)
+    streams = info.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), {})
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    probe = _VideoProbe(
+        video=tuple(
+            video.get(k) for k in ("codec_name", "width", "height", "r_frame_rate", "time_base")
+        ),
+        audio=(
+            tuple(audio.get(k) for k in ("codec_name", "sample_rate", "channels"))
+            if audio
+            else None
+        ),
+        duration=float(info.get("format", {}).get("duration") or 0),
+    )
+    _probe_cache[key] = probe
+    return probe
+
+
+def _concat_quote(path: str) -> str:
+    """concat demuxer 목록용 따옴표 처리 (경로 안의 작은따옴표는 '\\'' 로 이스케이프)"""
+    return "'" + path.replace("'", "'\\''") + "'"
+
+
+async def _run_ffmpeg(cmd: list[str]) -> None:
+    """ffmpeg 실행 (stderr는 전부 모으지 않고 한 줄씩 로그로 흘려보내고 마지막 부분만 보관)"""
+    # -nostats: \r로만 갱신되는 진행 표시 줄이 한 줄로 계속 쌓이지 않도록 끔
+    cmd = [cmd[0], "-nostats", *cmd[1:]]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    tail: deque[str] = deque(maxlen=_FFMPEG_STDERR_TAIL)
+    try:
+        async for raw_line in proc.stderr:
+            line = raw_line.decode(errors="replace").rstrip()
+            logger.debug("ffmpeg: %s", line)
+            tail.append(line)
+        returncode = await proc.wait()
+    except BaseException:
+        # 취소되면 ffmpeg가 계속 출력 파일을 쓰지 않도록 종료
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="\n".join(tail))
+
+
+def _reencode_concat_cmd(
+    video_paths: list[str], probes: list[_VideoProbe], output: str
+) -> list[str]:
+    """첫 세그먼트의 해상도/프레임레이트에 맞춰 재인코딩하며 합치는 ffmpeg 명령"""
+    _, width, height, fps, _ = probes[0].video
+    has_audio = any(probe.audio for probe in probes)
+
+    cmd = ["ffmpeg"]
+    filters: list[str] = []
+    concat_inputs = ""
+    for i, (path, probe) in enumerate(zip(video_paths, probes)):
+        cmd += ["-i", path]
+        filters.append(
+            f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,fps={fps},setsar=1[v{i}]"
+        )
+        concat_inputs += f"[v{i}]"
+        if has_audio:
+            if probe.audio:
+                filters.append(f"[{i}:a]aresample=48000,aformat=channel_layouts=stereo[a{i}]")
+            else:
+                # 오디오가 없는 세그먼트는 같은 길이의 무음으로 채움
+                filters.append(f"aevalsrc=0|0:c=stereo:s=48000:d={probe.duration}[a{i}]")
+            concat_inputs += f"[a{i}]"
+
+    if has_audio:
+        filters.append(f"{concat_inputs}concat=n={len(probes)}:v=1:a=1[v][a]")
+        cmd += ["-filter_complex", ";".join(filters), "-map", "[v]", "-map", "[a]"]
+        cmd += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "18", "-c:a", "aac"]
+    else:
+        filters.append(f"{concat_inputs}concat=n={len(probes)}:v=1:a=0[v]")
+        cmd += ["-filter_complex", ";".join(filters), "-map", "[v]"]
+        cmd += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "18"]
+    return cmd + [output]
+
 
 class Veo3VideoGenerator:
     """Google genai 라이브러리를 사용하여 Veo3 영상을 생성하는 클래스"""
@@ -17,19 +202,71 @@ class Veo3VideoGenerator:
         if not settings.google_api_key:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        self.client = genai.Client(api_key=settings.google_api_key)
+        self.client = shared_client(settings.google_api_key)
         self.output_dir = settings.output_dir
         self.character_image = self._load_character_image()
+        # 같은 입력(프롬프트/길이/비율/참조 이미지)으로 만든 세그먼트 재사용 목록
+        self._segment_index_path = self.output_dir / _SEGMENT_INDEX_NAME
+        self._segment_index: dict[str, dict] | None = None
+        self._character_digest = (
+            hashlib.sha256(self.character_image.image_bytes).hexdigest()
+            if self.character_image
+            else ""
+        )
 
     def _load_character_image(self) -> types.Image | None:
         """캐릭터 참조 이미지를 로드합니다"""
-        character_path = settings.character_image_path
-        if character_path and character_path.exists():
-            print(f"캐릭터 참조 이미지 로드: {character_path}")
-            return types.Image.from_file(str(character_path))
-        print("캐릭터 참조 이미지가 없습니다. character/ 디렉토리에 이미지를 추가하세요.")
+        image_bytes = settings.character_image_bytes
+        if image_bytes:
+            character_path = settings.character_image_path
+            logger.info("캐릭터 참조 이미지 로드: %s", character_path)
+            mime_type, _ = mimetypes.guess_type(character_path.name)
+            return types.Image(image_bytes=image_bytes, mime_type=mime_type or "image/png")
+        logger.warning("캐릭터 참조 이미지가 없습니다. character/ 디렉토리에 이미지를 추가하세요.")
         return None
 
+    def _segment_key(self, full_prompt: str, duration: int, aspect_ratio: str) -> str:
+        """세그먼트 재사용 키 (입력이 바이트 단위로 같을 때만 같은 키)"""
+        raw = f"{full_prompt}\0{duration}\0{aspect_ratio}\0{self._character_digest}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _load_segment_index(self) -> dict[str, dict]:
+        """세그먼트 재사용 목록 (처음 사용할 때 한 번만 파일에서 읽음)"""
+        if self._segment_index is None:
+            try:
+                self._segment_index = json.loads(self._segment_index_path.read_text())
+            except (OSError, ValueError):
+                self._segment_index = {}
+        return self._segment_index
+
+    def _cached_segment(self, key: str) -> str | None:
+        """재사용할 수 있는 세그먼트 경로 (파일이 없거나 바뀌었으면 None)"""
+        entry = self._load_segment_index().get(key)
+        if not entry:
+            return None
+        try:
+            if os.stat(entry["path"]).st_mtime_ns == entry["mtime_ns"]:
+                return entry["path"]
+        except (OSError, KeyError, TypeError):
+            pass
+        return None
+
+    def _remember_segment(self, key: str, path: str) -> None:
+        """생성한 세그먼트를 재사용 목록에 기록 (원자적 교체, 실패해도 무시)"""
+        index = self._load_segment_index()
+        tmp_path = self._segment_index_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            index[key] = {"path": path, "mtime_ns": os.stat(path).st_mtime_ns}
+            tmp_path.write_text(json.dumps(index))
+            os.replace(tmp_path, self._segment_index_path)
+        except OSError as error:
+            logger.debug("세그먼트 재사용 목록 저장 실패: %s", error)
+
+    def _discard_segment(self, path: str) -> None:
+        """합치지 못한 세그먼트 정리 (재사용 목록에 있으면 다음 실행에서 쓰도록 남김)"""
+        if path not in _indexed_segment_paths(self.output_dir):
+            Path(path).unlink(missing_ok=True)
+
     async def generate_video(
         self,
         prompt: str,
@@ -39,12 +276,14 @@ class Veo3VideoGenerator:
         negative_prompt: str = "realistic, human, scary",
     ) -> VideoGenerationResult:
         """Veo3 API를 사용하여 영상을 생성합니다"""
-        full_prompt = (
-            f"{prompt}, {style}, high quality, cute raccoon character, "
-            f"cooking video, shorts format, {aspect_ratio} aspect ratio, "
-            f"no dialogue, no speech, no narration, sound effects only, ambient cooking sounds, "
-            f"avoid: {negative_prompt}"
-        )
+        full_prompt = prompt + _prompt_suffix(style, aspect_ratio, negative_prompt)
+
+        # 같은 입력으로 만든 세그먼트가 남아 있으면 Veo3 호출 없이 재사용
+        segment_key = self._segment_key(full_prompt, duration, aspect_ratio)
+        cached_path = self._cached_segment(segment_key)
+        if cached_path:
+            logger.info("[캐시] 같은 프롬프트로 생성한 세그먼트 재사용: %s", cached_path)
+            return VideoGenerationResult(video_url=cached_path, status="completed")
 
         try:
             # 동기 API를 비동기로 실행
@@ -67,34 +306,56 @@ class Veo3VideoGenerator:
                 **generate_kwargs,
             )
 
-            # 작업 완료 대기
-            while not operation.done:
-                print("영상 생성 중...")
-                await asyncio.sleep(10)
-                operation = await asyncio.to_thread(self.client.operations.get, operation)
+            # 작업 완료 대기 (무한정 기다리지 않도록 최대 대기 시간 적용)
+            try:
+                operation = await asyncio.wait_for(
+                    self._wait_for_operation(operation), timeout=settings.veo3_max_wait
+                )
+            except TimeoutError:
+                # 기다리기만 멈춘 것이고 Veo3 작업은 계속 진행 중이므로 실패(모의 결과)로 보지 않음
+                logger.warning(
+                    "Veo3 영상 생성 대기 시간 초과 (%s초): %s",
+                    settings.veo3_max_wait,
+                    operation.name,
+                )
+                return VideoGenerationResult(operation_id=operation.name, status="processing")
 
             # 영상 다운로드
             if operation.response and operation.response.generated_videos:
                 video = operation.response.generated_videos[0]
-                await asyncio.to_thread(self.client.files.download, file=video.video)
-
-                filename = f"veo3_{int(time.time())}.mp4"
+                filename = _unique_filename("veo3")
                 filepath = self.output_dir / filename
-                await asyncio.to_thread(video.video.save, str(filepath))
+                await asyncio.to_thread(self._download_and_save, video.video, str(filepath))
+                self._remember_segment(segment_key, str(filepath))
 
                 return VideoGenerationResult(video_url=str(filepath), status="completed")
 
             raise ValueError("영상 생성 결과가 없습니다")
 
         except Exception as error:
-            print(f"Veo3 영상 생성 오류: {error}")
+            logger.warning("Veo3 영상 생성 오류: %s", error)
             # API가 아직 공개되지 않았을 경우를 대비한 모의 응답
             return await self._generate_mock_video(prompt)
 
+    def _download_and_save(self, video: types.Video, filepath: str) -> None:
+        """영상 다운로드와 저장을 스레드 한 번에서 처리"""
+        self.client.files.download(file=video)
+        video.save(filepath)
+
+    async def _wait_for_operation(self, operation):
+        """작업이 끝날 때까지 폴링 (2초에서 30초까지 지수 백오프 + 지터)"""
+        delay = 2.0
+        while not operation.done:
+            logger.debug("영상 생성 중...")
+            await asyncio.sleep(delay + random.uniform(0, 0.5))
+            delay = min(delay * 1.5, 30.0)
+            operation = await asyncio.to_thread(self.client.operations.get, operation)
+        return operation
+
     async def _generate_mock_video(self, prompt: str) -> VideoGenerationResult:
         """모의 영상 생성 (API가 사용 불가능할 때)"""
-        print(f"[모의] 영상 생성: {prompt}")
-        filename = f"mock_video_{int(time.time())}.mp4"
+        logger.info("[모의] 영상 생성: %s", prompt)
+        filename = _unique_filename("mock_video")
         filepath = self.output_dir / filename
 
         return VideoGenerationResult(video_url=str(filepath), status="completed", mock=True)
@@ -102,36 +363,89 @@ class Veo3VideoGenerator:
     async def generate_video_sequence(
         self, prompts: list[str], duration: int = 5, output_filename: str | None = None
     ) -> str:
-        """여러 프롬프트로 영상을 생성하고 합칩니다"""
-        videos: list[str] = []
-
-        for i, prompt in enumerate(prompts):
-            print(f"영상 {i + 1}/{len(prompts)} 생성 중...")
-
-            result = await self.generate_video(prompt, duration=duration)
-
-            if result.video_url and result.status == "completed":
-                videos.append(result.video_url)
-
-        # 영상 합치기
-        if len(videos) > 1:
-            return await self.merge_videos(videos, output_filename)
-
-        return videos[0] if videos else ""
+        """여러 프롬프트로 영상을 생성하고 합칩니다 (세그먼트는 동시에 생성, 실패 시 재시도)
+
+        시간 초과된 세그먼트는 Veo3 작업이 아직 진행 중이라 다시 요청하지 않고 건너뜁니다.
+        만들어진 세그먼트가 하나도 없으면 RuntimeError를 발생시킵니다.
+        """
+        # Veo3 할당량을 넘지 않도록 동시 생성 수 제한
+        semaphore = asyncio.Semaphore(max(1, settings.veo3_max_concurrency))
+
+        # 합치기 전에 실패하거나 취소되면 재사용 목록에 없는 세그먼트만 지우고, 성공하면 그대로 둠
+        # (목록에 있는 세그먼트는 재시도 때 Veo3 호출 없이 재사용)
+        with ExitStack() as cleanup:
+
+            async def generate(i: int, prompt: str) -> str | None:
+                for attempt in range(settings.veo3_max_retries + 1):
+                    async with semaphore:
+                        logger.info("영상 %s/%s 생성 중...", i + 1, len(unique_prompts))
+                        result = await self.generate_video(prompt, duration=duration)
+                    if result.status == "processing":
+                        # 다시 요청하면 진행 중인 유료 작업을 한 번 더 제출하게 됨
+                        return None
+                    # 모의 결과는 Veo3 호출이 실패했다는 뜻이고 실제 파일도 없음
+                    if result.status == "completed" and result.video_url and not result.mock:
+                        cleanup.callback(self._discard_segment, result.video_url)
+                        return result.video_url
+                    if attempt < settings.veo3_max_retries:
+                        # 세마포어 밖에서 기다려 다른 세그먼트는 계속 생성
+                        await asyncio.sleep(2**attempt)
+                return None
+
+            # 똑같은 프롬프트는 한 번만 생성하고 결과를 같이 사용
+            unique_prompts = list(dict.fromkeys(prompts))
+            unique_results = await asyncio.gather(
+                *(generate(i, prompt) for i, prompt in enumerate(unique_prompts)),
+                return_exceptions=True,
+            )
+            result_by_prompt = dict(zip(unique_prompts, unique_results))
+
+            # 합치는 순서는 원래 프롬프트 순서와 같음
+            videos: list[str] = []
+            for i, prompt in enumerate(prompts, start=1):
+                result = result_by_prompt[prompt]
+                if isinstance(result, BaseException):
+                    logger.error("영상 %s/%s 생성 실패: %s", i, len(prompts), result)
+                elif result:
+                    videos.append(result)
+                else:
+                    logger.warning("영상 %s/%s 생성 결과가 없습니다", i, len(prompts))
+
+            if not videos:
+                # 빈 경로나 모의 경로를 성공처럼 돌려주지 않음
+                raise RuntimeError(f"생성된 영상 세그먼트가 없습니다 (프롬프트 {len(prompts)}개)")
+
+            # 영상 합치기
+            if len(videos) > 1:
+                final_path = await self.merge_videos(videos, output_filename)
+            else:
+                final_path = videos[0]
+            cleanup.pop_all()
+            return final_path
 
     async def merge_videos(self, video_paths: list[str], output_filename: str | None = None) -> str:
         """여러 영상을 하나로 합칩니다 (ffmpeg 사용)"""
-        import subprocess
-
-        output_filename = output_filename or f"final_video_{int(time.time())}.mp4"
+        output_filename = output_filename or _unique_filename("final_video")
         output_path = self.output_dir / output_filename
 
-        # ffmpeg를 사용하여 영상 합치기
-        file_list_path = self.output_dir / "filelist.txt"
-        file_list_content = "\n".join(f"file '{path}'" for path in video_paths)
-        file_list_path.write_text(file_list_content)
-
+        # 세그먼트 스트림이 모두 같으면 재인코딩 없이 이어 붙이고, 다를 때만 재인코딩
         try:
+            probes = await asyncio.gather(*(_probe_video(path) for path in video_paths))
+            same_streams = len({(probe.video, probe.audio) for probe in probes}) == 1
+        except Exception as error:
+            # ffprobe를 쓸 수 없으면 기존처럼 스트림 복사로 시도
+            logger.warning("영상 정보 확인 실패, 스트림 복사로 합칩니다: %s", error)
+            probes, same_streams = [], True
+
+        file_list_path: Path | None = None
+        if same_streams:
+            # ffmpeg를 사용하여 영상 합치기 (동시에 합쳐도 겹치지 않도록 호출마다 임시 목록 파일 사용)
+            file_list_content = "\n".join(f"file {_concat_quote(path)}" for path in video_paths)
+            with tempfile.NamedTemporaryFile(
+                "w", suffix=".txt", prefix="filelist_", dir=self.output_dir, delete=False
+            ) as f:
+                f.write(file_list_content)
+            file_list_path = Path(f.name)
             cmd = [
                 "ffmpeg",
                 "-f",
@@ -144,14 +458,21 @@ class Veo3VideoGenerator:
                 "copy",
                 str(output_path),
             ]
+        else:
+            logger.info("세그먼트의 코덱/해상도가 달라 재인코딩하여 합칩니다")
+            cmd = _reencode_concat_cmd(video_paths, probes, str(output_path))
 
-            await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, check=True)
-
-            # 임시 파일 정리
-            file_list_path.unlink()
-
+        try:
+            await _run_ffmpeg(cmd)
             return str(output_path)
-        except subprocess.CalledProcessError as error:
-            print(f"영상 합치기 오류: {error}")
-            print(f"stderr: {error.stderr}")
+        except BaseException as error:
+            if isinstance(error, subprocess.CalledProcessError):
+                logger.error("영상 합치기 오류: %s", error)
+                logger.error("stderr: %s", error.stderr)
+            # 실패하거나 취소되면 쓰다 만 출력 파일도 남기지 않음
+            output_path.unlink(missing_ok=True)
             raise
+        finally:
+            # 임시 파일 정리 (실패해도 남기지 않음)
+            if file_list_path is not None:
+                file_list_path.unlink(missing_ok=True)
@@ -1,26 +1,39 @@
 """LangGraph 기반 워크플로우 에이전트"""
 
-import json
+import logging
+import time
+from collections import deque
 from datetime import datetime
 from typing import Literal
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, StateGraph
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.story_agent import StoryAgent
 from src.agents.video_agent import VideoAgent
 from src.agents.youtube_agent import YouTubeAgent
 from src.config import settings
-from src.database import AsyncSessionLocal
+from src.database import get_session_factory
 from src.models import StoryHistoryEntry, WorkflowState
 from src.repository import WorkflowExecutionRepository
+from src.video_generator import _sweep_orphan_segments, _unique_filename
+
+logger = logging.getLogger(__name__)
+
+# 히스토리 파일 검증용 (모듈 로드 시 한 번만 스키마를 빌드)
+_HISTORY_ADAPTER = TypeAdapter(list[StoryHistoryEntry])
 
 
 class VideoWorkflowAgent:
     """LangGraph 기반 영상 생성 워크플로우 에이전트"""
 
     def __init__(self, db_session: AsyncSession | None = None):
-        self.history_file = settings.data_dir / "story-history.json"
+        # 에피소드마다 한 줄씩 추가하는 JSONL 파일 (예전 JSON 배열 파일은 처음 로드할 때 변환)
+        self.history_file = settings.data_dir / "story-history.jsonl"
+        self._legacy_history_file = settings.data_dir / "story-history.json"
 
         # 데이터베이스 세션 (없으면 자동 생성)
         self.db_session = db_session
@@ -31,8 +44,9 @@ class VideoWorkflowAgent:
         self.video_agent = VideoAgent(db_session=db_session)
         self.youtube_agent = YouTubeAgent(db_session=db_session)
 
-        # 워크플로우 그래프 구성
-        self.graph = self._build_graph()
+        # 워크플로우 그래프 구성 (체크포인트를 쓸 때는 실행 시점에 checkpointer와 함께 컴파일)
+        self._workflow = self._build_graph()
+        self.graph = self._workflow.compile()
 
     def _build_graph(self) -> StateGraph:
         """LangGraph 워크플로우 그래프 구성"""
@@ -48,7 +62,11 @@ class VideoWorkflowAgent:
 
         # 엣지 추가
         workflow.set_entry_point("load_history")
-        workflow.add_edge("load_history", "generate_story")
+        workflow.add_conditional_edges(
+            "load_history",
+            self.should_continue_after_history,
+            {"continue": "generate_story", "error": "handle_error"},
+        )
         workflow.add_conditional_edges(
             "generate_story",
             self.should_continue_after_story,
@@ -67,41 +85,68 @@ class VideoWorkflowAgent:
         workflow.add_edge("save_history", END)
         workflow.add_edge("handle_error", END)
 
-        return workflow.compile()
+        return workflow
 
     async def load_history_node(self, state: WorkflowState) -> WorkflowState:
         """스토리 히스토리 로드"""
-        print("1. 스토리 히스토리 로드 중...")
+        logger.info("1. 스토리 히스토리 로드 중...")
         try:
             if self._use_db and self.db_session:
                 # StoryAgent를 사용하여 히스토리 로드
                 history = await self.story_agent.get_history()
                 state.story_history = history
+                # 조회로 시작된 트랜잭션을 닫아 Gemini 호출 동안 연결을 붙잡지 않음
+                await self.db_session.commit()
             else:
                 # 파일에서 로드 (기존 방식, 호환성 유지)
+                try:
+                    self._migrate_legacy_history()
+                except Exception as error:
+                    # 빈 히스토리로 진행하면 에피소드 1부터 다시 시작하고, 새 JSONL이 생기면
+                    # 변환도 다시 시도되지 않으므로 중단 (예전 파일은 그대로 두고 JSONL은 쓰지 않음)
+                    logger.error(
+                        "예전 히스토리 파일 변환 실패 (%s): %s", self._legacy_history_file, error
+                    )
+                    state.error = f"히스토리 파일 변환 실패: {error}"
+                    state.current_step = "load_history"
+                    return state
                 if self.history_file.exists():
-                    history_data = json.loads(self.history_file.read_text())
-                    history = [
-                        StoryHistoryEntry(**entry) if isinstance(entry, dict) else entry
-                        for entry in history_data
-                    ]
-                    state.story_history = history
+                    # 전체를 파싱하지 않고 마지막 N줄만 읽음
+                    with self.history_file.open(encoding="utf-8") as f:
+                        lines = deque(f, maxlen=settings.history_load_limit)
+                    # 줄들을 JSON 배열 하나로 묶어 pydantic-core에서 한 번에 검증
+                    records = ",".join(line for line in lines if line.strip())
+                    state.story_history = _HISTORY_ADAPTER.validate_json(f"[{records}]")
                 else:
                     state.story_history = []
         except Exception as error:
-            print(f"히스토리 로드 오류: {error}")
+            logger.warning("히스토리 로드 오류: %s", error)
             state.story_history = []
 
         state.current_step = "load_history"
         return state
 
+    def _migrate_legacy_history(self) -> None:
+        """예전 JSON 배열 히스토리 파일을 JSONL로 한 번 변환"""
+        if self.history_file.exists() or not self._legacy_history_file.exists():
+            return
+        entries = _HISTORY_ADAPTER.validate_json(self._legacy_history_file.read_bytes())
+        self.history_file.write_text(
+            "".join(f"{entry.model_dump_json()}\n" for entry in entries), encoding="utf-8"
+        )
+        self._legacy_history_file.rename(self._legacy_history_file.with_suffix(".json.bak"))
+
     async def generate_story_node(self, state: WorkflowState) -> WorkflowState:
         """스토리 생성 (StoryAgent 사용)"""
-        print("2. 새로운 스토리 생성 중...")
+        logger.info("2. 새로운 스토리 생성 중...")
         try:
-            episode = state.episode_number or len(state.story_history) + 1
+            # 히스토리는 최근 N개만 불러오므로 개수가 아닌 가장 큰 에피소드 번호 기준
+            # (DB 히스토리는 최신순, 파일 히스토리는 오래된 순)
+            episode = state.episode_number or (
+                max(h.episode for h in state.story_history) + 1 if state.story_history else 1
+            )
 
-            # StoryAgent 실행
+            # StoryAgent 실행 (각 단계의 기록은 바로 커밋해 외부 API 호출 동안 트랜잭션을 열어 두지 않음)
             result = await self.story_agent.run(
                 episode=episode,
                 save_to_db=self._use_db,
@@ -113,10 +158,10 @@ class VideoWorkflowAgent:
             state.story = result.story
             state.story_id = result.story_id
             state.current_step = "generate_story"
-            print(f"생성된 스토리: {result.story.title}")
+            logger.info("생성된 스토리: %s", result.story.title)
 
         except Exception as error:
-            print(f"스토리 생성 오류: {error}")
+            logger.error("스토리 생성 오류: %s", error)
             state.error = str(error)
             state.current_step = "error"
 
@@ -124,7 +169,7 @@ class VideoWorkflowAgent:
 
     async def generate_videos_node(self, state: WorkflowState) -> WorkflowState:
         """영상 생성 (VideoAgent 사용)"""
-        print("3. 영상 생성 중...")
+        logger.info("3. 영상 생성 중...")
         try:
             if not state.story:
                 raise ValueError("스토리가 생성되지 않았습니다.")
@@ -135,13 +180,16 @@ class VideoWorkflowAgent:
                     raise ValueError(
                         "skip_video_generation=True이지만 test_video_path가 설정되지 않았습니다."
                     )
-                print(f"[스킵] Veo3 영상 생성 스킵, 테스트 영상 사용: {settings.test_video_path}")
+                logger.info(
+                    "[스킵] Veo3 영상 생성 스킵, 테스트 영상 사용: %s", settings.test_video_path
+                )
                 state.final_video_path = settings.test_video_path
                 state.video_generation_id = None
                 state.current_step = "generate_videos"
                 return state
 
-            output_filename = f"video_{int(datetime.now().timestamp())}.mp4"
+            # 같은 초에 시작한 실행끼리도 겹치지 않는 파일명
+            output_filename = _unique_filename("video")
 
             # VideoAgent 실행
             result = await self.video_agent.run(
@@ -157,10 +205,10 @@ class VideoWorkflowAgent:
             state.final_video_path = result.video_path
             state.video_generation_id = result.video_generation_id
             state.current_step = "generate_videos"
-            print(f"영상 생성 완료: {result.video_path}")
+            logger.info("영상 생성 완료: %s", result.video_path)
 
         except Exception as error:
-            print(f"영상 생성 오류: {error}")
+            logger.error("영상 생성 오류: %s", error)
             state.error = str(error)
             state.current_step = "error"
 
@@ -168,7 +216,7 @@ class VideoWorkflowAgent:
 
     async def upload_to_youtube_node(self, state: WorkflowState) -> WorkflowState:
         """YouTube 업로드 (YouTubeAgent 사용)"""
-        print("4. YouTube 업로드 중...")
+        logger.info("4. YouTube 업로드 중...")
         try:
             if not state.story or not state.final_video_path:
                 raise ValueError("스토리나 영상 경로가 없습니다.")
@@ -197,10 +245,10 @@ class VideoWorkflowAgent:
             )
             state.youtube_upload_id = result.upload_record_id
             state.current_step = "upload_to_youtube"
-            print(f"업로드 완료: {result.video_url}")
+            logger.info("업로드 완료: %s", result.video_url)
 
         except Exception as error:
-            print(f"YouTube 업로드 오류: {error}")
+            logger.error("YouTube 업로드 오류: %s", error)
             state.error = str(error)
             state.current_step = "error"
 
@@ -208,42 +256,40 @@ class VideoWorkflowAgent:
 
     async def save_history_node(self, state: WorkflowState) -> WorkflowState:
         """히스토리 저장"""
-        print("5. 히스토리 저장 중...")
+        logger.info("5. 히스토리 저장 중...")
         try:
+            new_entry = None
+            if state.story:
+                new_entry = StoryHistoryEntry(
+                    episode=state.story.episode,
+                    date=state.story.date,
+                    title=state.story.title,
+                    dish=state.story.dish,
+                    summary=state.story.summary,
+                    story=state.story.story,
+                    cooking_steps=state.story.cooking_steps,
+                    video_prompts=state.story.video_prompts,
+                    tags=state.story.tags,
+                    description=state.story.description,
+                )
+
             if self._use_db and self.db_session:
-                # 데이터베이스는 이미 저장되어 있으므로 커밋만
-                await self.db_session.commit()
-                # 히스토리 다시 로드
-                history = await self.story_agent.get_history(limit=100)
-                state.story_history = history
+                # 스토리/영상/업로드 기록은 각 단계에서 이미 커밋됨
+                # 방금 저장한 스토리만 앞에 추가 (DB 히스토리는 최신순, 다시 조회하지 않음)
+                if new_entry:
+                    state.story_history = [new_entry, *state.story_history]
             else:
-                # 파일에 저장 (기존 방식, 호환성 유지)
+                # 파일에 저장 (새 에피소드 한 줄만 추가)
                 history = list(state.story_history)
-                if state.story:
-                    new_entry = StoryHistoryEntry(
-                        episode=state.story.episode,
-                        date=state.story.date,
-                        title=state.story.title,
-                        dish=state.story.dish,
-                        summary=state.story.summary,
-                        story=state.story.story,
-                        cooking_steps=state.story.cooking_steps,
-                        video_prompts=state.story.video_prompts,
-                        tags=state.story.tags,
-                        description=state.story.description,
-                    )
+                if new_entry:
                     history.append(new_entry)
-
-                history_data = [
-                    entry.model_dump() if hasattr(entry, "model_dump") else entry
-                    for entry in history
-                ]
-                self.history_file.write_text(json.dumps(history_data, ensure_ascii=False, indent=2))
+                    with self.history_file.open("a", encoding="utf-8") as f:
+                        f.write(f"{new_entry.model_dump_json()}\n")
                 state.story_history = history
 
             state.current_step = "save_history"
         except Exception as error:
-            print(f"히스토리 저장 오류: {error}")
+            logger.error("히스토리 저장 오류: %s", error)
             state.error = str(error)
             if self._use_db and self.db_session:
                 await self.db_session.rollback()
@@ -252,10 +298,14 @@ class VideoWorkflowAgent:
 
     def handle_error_node(self, state: WorkflowState) -> WorkflowState:
         """에러 처리"""
-        print(f"에러 발생: {state.error}")
+        logger.error("에러 발생: %s", state.error)
         state.current_step = "error"
         return state
 
+    def should_continue_after_history(self, state: WorkflowState) -> Literal["continue", "error"]:
+        """히스토리 로드 후 계속 진행 여부"""
+        return "error" if state.error else "continue"
+
     def should_continue_after_story(self, state: WorkflowState) -> Literal["continue", "error"]:
         """스토리 생성 후 계속 진행 여부"""
         if state.error or not state.story:
@@ -274,16 +324,34 @@ class VideoWorkflowAgent:
             return "error"
         return "continue"
 
+    async def _invoke_with_checkpoint(self, initial_state: WorkflowState, episode_number: int):
+        """체크포인트를 남기며 실행 (같은 에피소드의 이전 실행이 중간에 멈췄으면 그 지점부터 재개)"""
+        config: RunnableConfig = {"configurable": {"thread_id": f"episode-{episode_number}"}}
+        checkpoint_path = settings.data_dir / "workflow_checkpoints.db"
+        async with AsyncSqliteSaver.from_conn_string(str(checkpoint_path)) as saver:
+            graph = self._workflow.compile(checkpointer=saver)
+            snapshot = await graph.aget_state(config)
+            if snapshot.next:
+                logger.info("이전 실행의 체크포인트에서 재개: %s", ", ".join(snapshot.next))
+                return await graph.ainvoke(None, config)
+            # 끝까지 실행된 스레드에는 이전 실행의 값(error, story 등)이 남아 있으므로
+            # 모든 필드를 명시적으로 넘겨 덮어씀 (모델 인스턴스 입력은 설정된 필드만 기록됨)
+            fresh_input = {
+                name: getattr(initial_state, name) for name in WorkflowState.model_fields
+            }
+            return await graph.ainvoke(fresh_input, config)
+
     async def run(
         self, episode_number: int | None = None, private: bool = False
     ) -> WorkflowState:
         """워크플로우 실행"""
-        print("=== 일일 영상 생성 시작 ===")
+        logger.info("=== 일일 영상 생성 시작 ===")
+        started_at = time.time()
 
         # 데이터베이스 세션이 없으면 생성
         session = self.db_session
         if not session:
-            session = AsyncSessionLocal()
+            session = get_session_factory()()
             self.db_session = session
             self._use_db = True
 
@@ -309,45 +377,50 @@ class VideoWorkflowAgent:
                 execution_id=execution_id,
             )
 
-            # LangGraph 실행
-            final_state = await self.graph.ainvoke(initial_state)
+            # LangGraph 실행 (에피소드 번호가 정해진 실행은 체크포인트를 남겨 중단 시 재개)
+            if episode_number is not None:
+                output = await self._invoke_with_checkpoint(initial_state, episode_number)
+            else:
+                output = await self.graph.ainvoke(initial_state)
+            # LangGraph는 dict를 반환하므로 한 번만 WorkflowState로 변환
+            # (값은 이미 모델 인스턴스라 다시 검증되지 않음)
+            final_state = WorkflowState.model_validate(output)
 
             # 워크플로우 실행 기록 업데이트
-            # LangGraph returns dict, not object
-            error = final_state.get("error") if isinstance(final_state, dict) else final_state.error
+            error = final_state.error
             if self._use_db and execution_id:
                 exec_repo = WorkflowExecutionRepository(session)
                 status = "completed" if not error else "failed"
-                story_id = final_state.get("story_id") if isinstance(final_state, dict) else final_state.story_id
-                video_gen_id = final_state.get("video_generation_id") if isinstance(final_state, dict) else final_state.video_generation_id
-                yt_upload_id = final_state.get("youtube_upload_id") if isinstance(final_state, dict) else final_state.youtube_upload_id
                 await exec_repo.update(
                     execution_id,
                     status=status,
-                    story_id=story_id,
-                    video_generation_id=video_gen_id,
-                    youtube_upload_id=yt_upload_id,
+                    story_id=final_state.story_id,
+                    video_generation_id=final_state.video_generation_id,
+                    youtube_upload_id=final_state.youtube_upload_id,
                     error_message=error,
                 )
                 await session.commit()
 
             if error:
-                print(f"\n오류 발생: {error}")
+                logger.error("\n오류 발생: %s", error)
             else:
-                print("\n성공적으로 완료되었습니다!")
-                upload_result = final_state.get("upload_result") if isinstance(final_state, dict) else final_state.upload_result
-                story_history = final_state.get("story_history", []) if isinstance(final_state, dict) else final_state.story_history
-                if upload_result:
-                    print(f"에피소드: {len(story_history)}")
-                    print(f"영상 URL: {upload_result.url if hasattr(upload_result, 'url') else upload_result.get('url')}")
+                logger.info("\n성공적으로 완료되었습니다!")
+                if final_state.upload_result:
+                    logger.info("에피소드: %s", final_state.story.episode)
+                    logger.info("영상 URL: %s", final_state.upload_result.url)
 
             return final_state
         except Exception as error:
-            print(f"워크플로우 실행 오류: {error}")
+            logger.error("워크플로우 실행 오류: %s", error)
+            if self._use_db:
+                # 실패한 단계가 남긴 미완료 트랜잭션을 먼저 되돌려야 실행 기록을 갱신할 수 있음
+                await session.rollback()
             if self._use_db and execution_id:
                 exec_repo = WorkflowExecutionRepository(session)
                 await exec_repo.update(execution_id, status="failed", error_message=str(error))
                 await session.commit()
+            # 이번 실행에서 내려받았지만 어디에서도 쓰지 않는 세그먼트 정리
+            _sweep_orphan_segments(settings.output_dir, started_at)
             raise
         finally:
             # 세션을 직접 생성한 경우에만 닫기
@@ -1,6 +1,11 @@
 """YouTube API를 사용한 영상 업로드"""
 
 import asyncio
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -16,6 +21,54 @@ SCOPES = [
     "https://www.googleapis.com/auth/youtube",
 ]
 
+logger = logging.getLogger(__name__)
+
+
+def _build_youtube(credentials: Credentials):
+    """YouTube API 리소스 생성 (라이브러리에 포함된 discovery 문서 사용, 네트워크 조회 없음)"""
+    return build(
+        "youtube", "v3", credentials=credentials, static_discovery=True, cache_discovery=False
+    )
+
+
+def _refresh_token_digest() -> str:
+    """토큰 캐시가 어떤 refresh token으로 발급됐는지 확인하는 값 (refresh token 자체는 저장하지 않음)"""
+    return hashlib.sha256(settings.youtube_refresh_token.encode()).hexdigest()
+
+
+def _load_cached_token() -> tuple[str, datetime] | None:
+    """이전 프로세스가 저장한 access token과 만료 시각"""
+    try:
+        data = json.loads((settings.cache_dir / "yt_token.json").read_text())
+        if data.get("refresh_token_sha256") != _refresh_token_digest():
+            return None
+        return data["token"], datetime.fromisoformat(data["expiry"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save_cached_token(credentials: Credentials) -> None:
+    """갱신한 access token을 다음 프로세스가 재사용하도록 저장 (0600, 원자적 교체)"""
+    if not credentials.token or not credentials.expiry:
+        return
+    token_path = settings.cache_dir / "yt_token.json"
+    tmp_path = token_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        token_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "token": credentials.token,
+                    "expiry": credentials.expiry.isoformat(),
+                    "refresh_token_sha256": _refresh_token_digest(),
+                },
+                f,
+            )
+        os.replace(tmp_path, token_path)
+    except OSError:
+        pass
+
 
 class YouTubeUploader:
     """YouTube API를 사용하여 영상을 업로드하는 클래스"""
@@ -23,24 +76,35 @@ class YouTubeUploader:
     def __init__(self):
         self.credentials: Credentials | None = None
         self.youtube = None
-
-        if settings.youtube_refresh_token:
-            try:
-                self._init_client()
-            except Exception as e:
-                print(f"[YouTubeUploader] 초기화 실패 (나중에 재시도): {e}")
+        # 클라이언트는 처음 사용할 때 초기화 (생성 시점에 네트워크 호출 없음)
+        self._init_lock = asyncio.Lock()
 
     def _init_client(self) -> None:
-        """YouTube API 클라이언트 초기화"""
+        """YouTube API 클라이언트 초기화 (저장된 access token이 유효하면 갱신 생략)"""
+        cached = _load_cached_token()
         self.credentials = Credentials(
-            token=None,
+            token=cached[0] if cached else None,
+            expiry=cached[1] if cached else None,
             refresh_token=settings.youtube_refresh_token,
             token_uri="https://oauth2.googleapis.com/token",
             client_id=settings.youtube_client_id,
             client_secret=settings.youtube_client_secret,
         )
-        self.credentials.refresh(Request())
-        self.youtube = build("youtube", "v3", credentials=self.credentials)
+        # valid는 만료 직전(수 분 이내)이면 False
+        if not self.credentials.valid:
+            self.credentials.refresh(Request())
+            _save_cached_token(self.credentials)
+        self.youtube = _build_youtube(self.credentials)
+
+    async def _ensure_client(self) -> None:
+        """처음 사용할 때 클라이언트를 초기화 (토큰 갱신은 스레드에서 실행)"""
+        if self.youtube:
+            return
+        if not settings.youtube_refresh_token:
+            raise RuntimeError("YouTube API 클라이언트가 초기화되지 않았습니다.")
+        async with self._init_lock:
+            if not self.youtube:
+                await asyncio.to_thread(self._init_client)
 
     def get_auth_url(self) -> str:
         """OAuth 인증 URL 생성"""
@@ -73,7 +137,7 @@ class YouTubeUploader:
         )
         flow.fetch_token(code=code)
         self.credentials = flow.credentials
-        self.youtube = build("youtube", "v3", credentials=self.credentials)
+        self.youtube = _build_youtube(self.credentials)
 
         return {
             "access_token": self.credentials.token,
@@ -91,8 +155,7 @@ class YouTubeUploader:
         is_shorts: bool = True,
     ) -> YouTubeUploadResult:
         """영상을 YouTube에 업로드"""
-        if not self.youtube:
-            raise RuntimeError("YouTube API 클라이언트가 초기화되지 않았습니다.")
+        await self._ensure_client()
 
         if is_shorts:
             title = f"{title} #Shorts"
@@ -112,7 +175,10 @@ class YouTubeUploader:
             },
         }
 
-        media = MediaFileUpload(video_path, chunksize=-1, resumable=True)
+        # 청크 단위로 올려서 일시적인 오류 시 파일 전체가 아닌 해당 청크만 다시 전송
+        media = MediaFileUpload(
+            video_path, chunksize=settings.youtube_upload_chunk_size, resumable=True
+        )
 
         def _do_upload():
             request = self.youtube.videos().insert(
@@ -121,10 +187,16 @@ class YouTubeUploader:
                 media_body=media,
             )
             response = None
+            last_percent = -5
             while response is None:
-                status, response = request.next_chunk()
+                # 일시적인 오류(5xx 등)는 라이브러리의 지수 백오프로 재시도
+                status, response = request.next_chunk(num_retries=3)
                 if status:
-                    print(f"업로드 진행률: {int(status.progress() * 100)}%")
+                    # 5% 이상 바뀌었을 때만 기록
+                    percent = int(status.progress() * 100)
+                    if percent - last_percent >= 5:
+                        logger.info("업로드 진행률: %d%%", percent)
+                        last_percent = percent
             return response
 
         response = await asyncio.to_thread(_do_upload)
@@ -137,8 +209,7 @@ class YouTubeUploader:
 
     async def get_video_info(self, video_id: str) -> dict:
         """업로드된 영상 정보 조회"""
-        if not self.youtube:
-            raise RuntimeError("YouTube API 클라이언트가 초기화되지 않았습니다.")
+        await self._ensure_client()
 
         def _get():
             return (